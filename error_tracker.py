@@ -1,29 +1,51 @@
 #!/usr/bin/env python3
 
-from datetime import datetime
-from collections import defaultdict
+import time
+from functools import lru_cache
+from collections import defaultdict, deque
+
+@lru_cache(maxsize=1)
+def _format_second(second):
+    # Errors arrive in bursts, so consecutive records usually share the same second
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+
+class ErrorRecord:
+    __slots__ = ('created', 'type', 'message', 'url', 'is_warning', 'retry_count')
+
+    def __init__(self, error_type, message, url, retry_count=None, is_warning=False):
+        self.created = time.time()
+        self.type = error_type
+        self.message = message
+        self.url = url
+        self.is_warning = is_warning
+        self.retry_count = retry_count
+
+    @property
+    def timestamp(self):
+        return _format_second(int(self.created))
 
 class ErrorTracker:
-    def __init__(self):
-        self.errors = []
+    # Only the most recent errors are kept in full; counts always cover every error
+    MAX_RECENT_ERRORS = 10_000
+
+    def __init__(self, max_recent_errors=MAX_RECENT_ERRORS):
+        self.errors = deque(maxlen=max_recent_errors)
         self.error_counts = defaultdict(int)
         self.total_errors = 0
         self.total_warnings = 0
 
     def add_error(self, error_type, message, url, retry_count=None, is_warning=False):
-        error = {
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'type': error_type,
-            'message': message,
-            'url': url,
-            'is_warning': is_warning
-        }
-        if retry_count is not None:
-            error['retry_count'] = retry_count
-        
-        self.errors.append(error)
+        self.errors.append(ErrorRecord(error_type, message, url, retry_count, is_warning))
         self.error_counts[error_type] += 1
         if is_warning:
             self.total_warnings += 1
         else:
-            self.total_errors += 1
\ No newline at end of file
+            self.total_errors += 1
+
+    def summary(self):
+        return {
+            'total_errors': self.total_errors,
+            'total_warnings': self.total_warnings,
+            'error_counts': dict(self.error_counts),
+            'recent_errors': list(self.errors)
+        }
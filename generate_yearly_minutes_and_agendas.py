@@ -2,20 +2,271 @@
 
 import pandas as pd
 import os
+import csv
+import json
+import logging
+import logging.handlers
+import queue
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
 from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Flowable
 from reportlab.lib.styles import getSampleStyleSheet
+from pypdf import PdfReader
+import pikepdf
 from datetime import datetime
 
+# Configure logging
+logger = logging.getLogger(__name__)
+
 # Configuration
 board_name = "Planning_Board"  # Board to process
 data_dir = "Hardwick_Data"
 year = 2024  # Year for the report (set to None to process all years)
 
-# List of document extensions that LibreOffice can convert to PDF
-SUPPORTED_DOC_EXTENSIONS = {'.doc', '.docx', '.odf', '.odt', '.rtf'}
+# Lowercased document extensions (without the dot) that LibreOffice can convert to PDF
+SUPPORTED_DOC_EXTENSIONS = frozenset({'doc', 'docx', 'odf', 'odt', 'rtf'})
+
+# Timestamp format written to the meeting and document CSVs (second resolution)
+CSV_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Only these CSV columns are used by the report
+MEETING_CSV_COLUMNS = ["Timestamp", "Agenda"]
+DOCUMENT_CSV_COLUMNS = ["Timestamp", "File Name", "File Path"]
+
+def present_columns(csv_path, columns):
+    """
+    Pick the wanted columns that a CSV file actually has, so a missing optional column isn't an error.
+
+    Args:
+        csv_path (str): Path to the CSV file.
+        columns (list of str): Wanted column names.
+
+    Returns:
+        list of str: The wanted columns found in the file's header, in the order given.
+    """
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        header = set(next(csv.reader(f), []))
+    return [column for column in columns if column in header]
+
+def read_report_csv(csv_path, columns):
+    """
+    Read the wanted columns of a meeting or document CSV with the pyarrow engine.
+
+    Args:
+        csv_path (str): Path to the CSV file.
+        columns (list of str): Wanted column names; any the file lacks are left out.
+
+    Returns:
+        pandas.DataFrame: The CSV's rows, with pyarrow-backed columns.
+    """
+    return pd.read_csv(csv_path, engine="pyarrow", usecols=present_columns(csv_path, columns), dtype_backend="pyarrow")
+
+def attachment_extensions(file_paths):
+    """
+    Get the lowercased file extension of every attachment path in one vectorized pass.
+
+    Args:
+        file_paths (pandas.Series): Attachment file paths, of object or pyarrow string dtype.
+
+    Returns:
+        pandas.Series: Extensions without the dot, or "" for paths without one.
+    """
+    # The arrow string accessor only extracts named groups from str patterns
+    return file_paths.str.extract(r"\.(?P<ext>[^./\\]+)$", expand=False).str.lower().fillna("")
+
+def count_pdf_pages(pdf_path):
+    """
+    Count the pages in a PDF file without spawning an external process.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+
+    Returns:
+        int: Number of pages in the PDF.
+    """
+    return len(PdfReader(pdf_path, strict=False).pages)
+
+def open_pdf_or_none(pdf_path):
+    """
+    Open a PDF with pikepdf, logging and returning None if it cannot be read.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+
+    Returns:
+        pikepdf.Pdf or None: The open PDF, or None if it could not be read.
+    """
+    try:
+        return pikepdf.Pdf.open(pdf_path)
+    except Exception as e:
+        logger.error(f"Error reading {pdf_path}: {e}")
+        return None
+
+def merge_pdfs(inputs, output_path, sources=None):
+    """
+    Concatenate PDF files into a single PDF using pikepdf (QPDF) in-process.
+
+    Args:
+        inputs (list): PDFs to merge, in order. Each item is either a path, or a
+            (path, start, stop) tuple selecting pages[start:stop] of that PDF.
+            A PDF listed several times is only opened once.
+        output_path (str): Path to save the merged PDF.
+        sources (dict or None): Already open pikepdf.Pdf objects by path, reused
+            instead of opening those files again. They are closed along with the rest.
+    """
+    sources = dict(sources or {})
+    try:
+        with pikepdf.Pdf.new() as merged:
+            for item in inputs:
+                input_path, start, stop = item if isinstance(item, tuple) else (item, None, None)
+                if input_path not in sources:
+                    sources[input_path] = pikepdf.Pdf.open(input_path)
+                merged.pages.extend(sources[input_path].pages[start:stop])
+            merged.save(output_path)
+    finally:
+        for source in sources.values():
+            source.close()
+
+class _PageMarker(Flowable):
+    """
+    Zero-size flowable that records the page number it is drawn on.
+    """
+    def __init__(self, page_numbers):
+        super().__init__()
+        self.page_numbers = page_numbers
+
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+
+    def draw(self):
+        self.page_numbers.append(self.canv.getPageNumber())
+
+def _finalize_converted_pdf(input_path, output_path, generated_dir):
+    """
+    Move a PDF produced by LibreOffice to its target path and verify it is non-empty.
+
+    Args:
+        input_path (str): Path to the source document file.
+        output_path (str): Path to save the output PDF in Attachments folder.
+        generated_dir (str): Directory LibreOffice wrote its output to.
+
+    Returns:
+        bool: True if a non-empty PDF now exists at output_path, False otherwise.
+    """
+    # libreoffice names the PDF after the input file; move it to the requested name
+    generated_pdf = os.path.join(generated_dir, os.path.splitext(os.path.basename(input_path))[0] + ".pdf")
+    try:
+        generated_size = os.stat(generated_pdf).st_size
+    except FileNotFoundError:
+        logger.error(f"LibreOffice did not generate expected PDF for {input_path}")
+        return False
+    if generated_size == 0:
+        logger.error(f"Generated PDF {output_path} is empty")
+        return False
+    os.replace(generated_pdf, output_path)
+    logger.info(f"Generated PDF {output_path} ({generated_size} bytes)")
+    return True
+
+def _convert_docs_batch(pairs):
+    """
+    Convert a batch of documents sharing one output directory in a single LibreOffice run.
+
+    Each batch gets its own throwaway user profile so several LibreOffice
+    instances can run side by side instead of serializing on the default profile,
+    and its own scratch output directory so batches never overwrite each other's
+    output. The scratch directory lives inside the target directory so the final
+    os.replace stays on one filesystem.
+
+    Args:
+        pairs (list of tuple): (input_path, output_path) pairs with a common output
+            directory and distinct input base names.
+
+    Returns:
+        dict: Maps each input_path to True if conversion succeeded, False otherwise.
+    """
+    results = {}
+    outdir = os.path.dirname(pairs[0][1])
+    # LibreOffice used to create --outdir itself; the scratch directory now needs it to exist first
+    os.makedirs(outdir or ".", exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="lo_profile_") as profile_dir, \
+            tempfile.TemporaryDirectory(prefix=".lo_out_", dir=outdir) as generated_dir:
+        try:
+            # Run libreoffice command once for every document in this batch
+            subprocess.run(
+                ["libreoffice", f"-env:UserInstallation={Path(profile_dir).as_uri()}", "--headless",
+                 "--convert-to", "pdf", "--outdir", generated_dir] + [input_path for input_path, _ in pairs],
+                check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+            )
+        except subprocess.CalledProcessError as e:
+            # Some documents may still have converted; the per-file check below sorts them out
+            logger.error(f"Error converting documents in {outdir} to PDF with LibreOffice: {e.stderr}")
+        except Exception as e:
+            logger.error(f"Unexpected error converting documents in {outdir} to PDF: {e}")
+            return {input_path: False for input_path, _ in pairs}
+
+        for input_path, output_path in pairs:
+            try:
+                results[input_path] = _finalize_converted_pdf(input_path, output_path, generated_dir)
+            except Exception as e:
+                logger.error(f"Unexpected error converting {input_path} to PDF: {e}")
+                results[input_path] = False
+    return results
+
+def _split_conversion_batches(pairs, batch_count):
+    """
+    Split conversions round-robin into batches whose input base names are unique per batch.
+
+    LibreOffice names its output after the input base name, so two documents
+    such as minutes.doc and minutes.docx must not share a batch.
+    """
+    batches = [[] for _ in range(batch_count)]
+    batch_stems = [set() for _ in range(batch_count)]
+    for i, (input_path, output_path) in enumerate(pairs):
+        stem = os.path.splitext(os.path.basename(input_path))[0]
+        target = i % batch_count
+        while stem in batch_stems[target]:
+            target += 1
+            if target == len(batches):
+                batches.append([])
+                batch_stems.append(set())
+        batches[target].append((input_path, output_path))
+        batch_stems[target].add(stem)
+    return [batch for batch in batches if batch]
+
+def batch_convert_docs_to_pdf(conversions, max_workers=None):
+    """
+    Convert document files to PDF using a pool of batched LibreOffice invocations.
+
+    LibreOffice accepts many input files per call, so each worker converts a whole
+    batch per startup; batches run in parallel, one LibreOffice instance per worker.
+
+    Args:
+        conversions (list of tuple): (input_path, output_path) pairs to convert.
+        max_workers (int or None): Number of concurrent LibreOffice instances (default: CPU count).
+
+    Returns:
+        dict: Maps each input_path to True if conversion succeeded, False otherwise.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    by_outdir = {}
+    for input_path, output_path in conversions:
+        by_outdir.setdefault(os.path.dirname(output_path), []).append((input_path, output_path))
+
+    # Split each output directory's documents across the workers
+    batches = []
+    for pairs in by_outdir.values():
+        batches.extend(_split_conversion_batches(pairs, min(max_workers, len(pairs))))
+
+    results = {}
+    if not batches:
+        return results
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+        for batch_results in executor.map(_convert_docs_batch, batches):
+            results.update(batch_results)
+    return results
 
 def convert_doc_to_pdf(input_path, output_path):
     """
@@ -28,32 +279,92 @@ def convert_doc_to_pdf(input_path, output_path):
     Returns:
         bool: True if conversion succeeded, False otherwise.
     """
+    return batch_convert_docs_to_pdf([(input_path, output_path)])[input_path]
+
+def _attachment_pdf_path(file_path, attachments_dir):
+    """
+    Return the path in the Attachments folder where a converted document's PDF is stored.
+    """
+    pdf_name = f"{os.path.splitext(os.path.basename(file_path))[0]}.pdf"
+    return os.path.join(attachments_dir, pdf_name)
+
+def load_conversion_cache(cache_path):
+    """
+    Load the index of previously converted attachment PDFs.
+
+    Args:
+        cache_path (str): Path to the JSON cache index.
+
+    Returns:
+        dict: Maps absolute source paths to {"mtime_ns", "size", "pdf"} entries.
+    """
+    if not os.path.exists(cache_path):
+        return {}
     try:
-        # Run libreoffice command to convert document to PDF
-        subprocess.run(
-            ["libreoffice", "--headless", "--convert-to", "pdf", "--outdir", os.path.dirname(output_path), input_path],
-            check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
-        # libreoffice saves the PDF with the same base name in the output directory; rename if needed
-        generated_pdf = os.path.join(os.path.dirname(output_path), os.path.splitext(os.path.basename(input_path))[0] + ".pdf")
-        if os.path.exists(generated_pdf):
-            os.rename(generated_pdf, output_path)
-            if os.path.getsize(output_path) > 0:
-                print(f"Generated PDF {output_path} ({os.path.getsize(output_path)} bytes)")
-                return True
-            else:
-                print(f"Error: Generated PDF {output_path} is empty")
-                os.remove(output_path)
-                return False
-        else:
-            print(f"Error: LibreOffice did not generate expected PDF for {input_path}")
-            return False
-    except subprocess.CalledProcessError as e:
-        print(f"Error converting {input_path} to PDF with LibreOffice: {e.stderr}")
-        return False
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
     except Exception as e:
-        print(f"Unexpected error converting {input_path} to PDF: {e}")
-        return False
+        logger.warning(f"Could not read conversion cache {cache_path}: {e}")
+        return {}
+
+def save_conversion_cache(cache_path, cache):
+    """
+    Save the index of converted attachment PDFs, replacing the previous file atomically.
+
+    Args:
+        cache_path (str): Path to the JSON cache index.
+        cache (dict): Cache entries as returned by load_conversion_cache.
+    """
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Could not write conversion cache {cache_path}: {e}")
+
+def _file_stat(path, dir_listings):
+    """
+    Look up a file's stat result through a memoized os.scandir listing of its directory.
+
+    Each directory is listed once and shared by every lookup, instead of one
+    os.path.exists/os.stat round-trip per check. Drop a directory's entry from
+    dir_listings to rescan it after files were added.
+
+    Args:
+        path (str): Path of the file.
+        dir_listings (dict): Directory listings cached so far, keyed by absolute directory path.
+
+    Returns:
+        os.stat_result or None: The file's stat result, or None if it does not exist.
+    """
+    if not isinstance(path, str) or not path:
+        return None
+    directory, name = os.path.split(os.path.abspath(path))
+    listing = dir_listings.get(directory)
+    if listing is None:
+        try:
+            with os.scandir(directory) as entries:
+                listing = {entry.name: entry for entry in entries}
+        except OSError:
+            listing = {}
+        dir_listings[directory] = listing
+    entry = listing.get(name)
+    if entry is None or not entry.is_file():
+        return None
+    return entry.stat()  # DirEntry caches this, so repeat lookups are free
+
+def _is_conversion_cached(cache, file_path, source_stat, dir_listings):
+    """
+    Return True if the cache holds an up-to-date PDF for the given source document.
+    """
+    entry = cache.get(os.path.abspath(file_path))
+    return (
+        entry is not None
+        and entry.get("mtime_ns") == source_stat.st_mtime_ns
+        and entry.get("size") == source_stat.st_size
+        and _file_stat(entry.get("pdf", ""), dir_listings) is not None
+    )
 
 def generate_yearly_report(board_name, year, data_dir="Hardwick_Data"):
     """
@@ -69,57 +380,66 @@ def generate_yearly_report(board_name, year, data_dir="Hardwick_Data"):
     meeting_csv = os.path.join(board_dir, "meeting_data.csv")
     documents_csv = os.path.join(board_dir, "meeting_documents.csv")
     attachments_dir = os.path.join(board_dir, "Attachments")
+    conversion_cache_path = os.path.join(board_dir, ".pdf_cache.json")
     output_suffix = f"All_Years" if year is None else str(year)
     output_pdf = os.path.join(board_dir, f"Yearly_Minutes_and_Agendas_{output_suffix}.pdf")
 
     # Check if input files exist
     if not os.path.exists(meeting_csv):
-        print(f"Error: {meeting_csv} not found")
+        logger.error(f"{meeting_csv} not found")
         return
     if not os.path.exists(documents_csv):
-        print(f"Warning: {documents_csv} not found, proceeding without attachments")
+        logger.warning(f"{documents_csv} not found, proceeding without attachments")
 
     # Read CSV files
     try:
-        meetings_df = pd.read_csv(meeting_csv)
+        meetings_df = read_report_csv(meeting_csv, MEETING_CSV_COLUMNS)
     except Exception as e:
-        print(f"Error reading {meeting_csv}: {e}")
+        logger.error(f"Error reading {meeting_csv}: {e}")
         return
-    documents_df = pd.DataFrame(columns=["Board", "Time", "Timestamp", "File Name", "Download URL", "File Path"])
+    documents_df = pd.DataFrame(columns=DOCUMENT_CSV_COLUMNS)
     if os.path.exists(documents_csv):
         try:
-            documents_df = pd.read_csv(documents_csv)
+            documents_df = read_report_csv(documents_csv, DOCUMENT_CSV_COLUMNS)
         except Exception as e:
-            print(f"Error reading {documents_csv}: {e}")
+            logger.error(f"Error reading {documents_csv}: {e}")
 
-    # Normalize timestamps to seconds
-    meetings_df["Timestamp"] = pd.to_datetime(meetings_df["Timestamp"], errors='coerce').dt.floor("s")
+    # Parse timestamps with the known CSV format; cache=True parses each distinct string once
+    meetings_df["Timestamp"] = pd.to_datetime(meetings_df["Timestamp"], format=CSV_TIMESTAMP_FORMAT, errors='coerce', cache=True)
     if not documents_df.empty:
-        documents_df["Timestamp"] = pd.to_datetime(documents_df["Timestamp"], errors='coerce').dt.floor("s")
+        documents_df["Timestamp"] = pd.to_datetime(documents_df["Timestamp"], format=CSV_TIMESTAMP_FORMAT, errors='coerce', cache=True)
 
-    # Debug: Print unique timestamps
-    print(f"Meeting timestamps: {meetings_df['Timestamp'].dropna().unique()}")
-    if not documents_df.empty:
-        print(f"Document timestamps: {documents_df['Timestamp'].dropna().unique()}")
+    # Debug: Log unique timestamps; computing and formatting them scans whole columns, so only when logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Meeting timestamps: {meetings_df['Timestamp'].dropna().unique()}")
+        if not documents_df.empty:
+            logger.debug(f"Document timestamps: {documents_df['Timestamp'].dropna().unique()}")
 
     # Filter meetings by year (or include all if year is None)
     if year is not None:
         meetings_df = meetings_df[meetings_df["Timestamp"].dt.year == year]
     meetings_df = meetings_df.sort_values(by="Timestamp", ascending=True)  # Chronological order
     if meetings_df.empty:
-        print(f"No meetings found for {board_name} in {'all years' if year is None else year}")
+        logger.warning(f"No meetings found for {board_name} in {'all years' if year is None else year}")
         return
 
+    # Narrow documents to the report year once, then to the report's meetings, so that
+    # every later step (summary, conversions, grouping) only touches the rows it needs
+    has_documents = not documents_df.empty
+    if year is not None and has_documents:
+        documents_df = documents_df[documents_df["Timestamp"].dt.year == year]
+    total_attachments = len(documents_df)
+    meeting_documents_df = documents_df[documents_df["Timestamp"].isin(meetings_df["Timestamp"])] if has_documents else documents_df
+    meeting_documents_df = meeting_documents_df.assign(Extension=attachment_extensions(meeting_documents_df["File Path"]))
+
     # Calculate summary statistics
     total_meetings = len(meetings_df)
     meeting_dates = meetings_df["Timestamp"].dt.strftime("%B %d").tolist()
     meeting_dates_str = ", ".join(meeting_dates)
-    total_attachments = len(documents_df[documents_df["Timestamp"].dt.year == year]) if year is not None and not documents_df.empty else len(documents_df)
 
     # Prepare PDF components
     styles = getSampleStyleSheet()
     temp_files = []
-    meeting_pdfs = []
 
     # Title page with summary
     title_pdf = os.path.join(tempfile.gettempdir(), "title_page.pdf")
@@ -148,174 +468,223 @@ def generate_yearly_report(board_name, year, data_dir="Hardwick_Data"):
         title_story.append(Paragraph(line, styles["Normal"]))
         title_story.append(Spacer(1, 6))
 
-    title_doc.build(title_story)
     temp_files.append(title_pdf)
+    final_pdf_files = [title_pdf]
+
+    # Create a single blank page PDF with minimal content, shared by every meeting for separation
+    blank_page_pdf = os.path.join(tempfile.gettempdir(), "blank_page.pdf")
+    blank_doc = SimpleDocTemplate(blank_page_pdf, pagesize=letter)
+    temp_files.append(blank_page_pdf)
+
+    # Build both small pages on one background thread while LibreOffice runs (the conversions wait on a
+    # subprocess and release the GIL); it is joined before the meetings build so ReportLab never runs twice at once
+    def build_title_and_blank_pages():
+        title_doc.build(title_story)
+        blank_doc.build([Paragraph("", styles["Normal"])])  # Empty paragraph
+
+    page_builder = ThreadPoolExecutor(max_workers=1)
+    page_build = page_builder.submit(build_title_and_blank_pages)
+    page_builder.shutdown(wait=False)
+
+    # Convert every pending document up front so LibreOffice only starts once;
+    # documents unchanged since their last conversion are served from the cache
+    conversion_cache = load_conversion_cache(conversion_cache_path)
+    dir_listings = {}
+    source_stats = {}
+    pending_conversions = []
+    if not meeting_documents_df.empty:
+        for doc in meeting_documents_df.to_dict("records"):
+            file_path = doc.get("File Path", "")
+            source_stat = _file_stat(file_path, dir_listings)
+            if source_stat is None:
+                continue
+            if doc["Extension"] not in SUPPORTED_DOC_EXTENSIONS:
+                continue
+            final_pdf_path = _attachment_pdf_path(file_path, attachments_dir)
+            source_stats[file_path] = (final_pdf_path, source_stat)
+            if _is_conversion_cached(conversion_cache, file_path, source_stat, dir_listings):
+                continue
+            # Adopt PDFs converted before the cache existed, as long as they are newer than the source
+            final_pdf_stat = _file_stat(final_pdf_path, dir_listings)
+            if final_pdf_stat is not None and final_pdf_stat.st_mtime_ns >= source_stat.st_mtime_ns:
+                continue
+            pending_conversions.append((file_path, final_pdf_path))
+    conversion_results = batch_convert_docs_to_pdf(pending_conversions) if pending_conversions else {}
+    if pending_conversions:
+        # Conversions added files to the Attachments folder; rescan it on next lookup
+        dir_listings.pop(os.path.abspath(attachments_dir), None)
+    for file_path, (final_pdf_path, source_stat) in source_stats.items():
+        if conversion_results.get(file_path, True) and _file_stat(final_pdf_path, dir_listings) is not None:
+            conversion_cache[os.path.abspath(file_path)] = {
+                "mtime_ns": source_stat.st_mtime_ns,
+                "size": source_stat.st_size,
+                "pdf": final_pdf_path
+            }
+    if source_stats:
+        save_conversion_cache(conversion_cache_path, conversion_cache)
+
+    # Group attachments by meeting timestamp once instead of scanning per meeting
+    docs_by_timestamp = dict(iter(meeting_documents_df.groupby("Timestamp"))) if not meeting_documents_df.empty else {}
+
+    # All meeting text goes into one ReportLab document; the marker at the end of
+    # each meeting records its last page so attachments can be spliced in after it
+    text_story = []
+    text_page_ends = []
+    meeting_sections = []
 
     # Process each meeting
-    for idx, meeting in meetings_df.iterrows():
-        timestamp = meeting["Timestamp"]
-        agenda = meeting.get("Agenda", "")
+    for meeting in meetings_df.itertuples(index=False, name="Meeting"):
+        timestamp = meeting.Timestamp
+        agenda = getattr(meeting, "Agenda", "")
         if pd.isna(agenda):
             agenda = "No agenda available"
 
         # Create text content for this meeting
-        story = []
+        if text_story:
+            text_story.append(PageBreak())
         meeting_date = timestamp.strftime("%B %d, %Y %I:%M %p")
-        story.append(Paragraph(f"Meeting: {meeting_date}", styles["Heading2"]))
-        story.append(Spacer(1, 12))
-        story.append(Paragraph("Agenda", styles["Heading3"]))
+        text_story.append(Paragraph(f"Meeting: {meeting_date}", styles["Heading2"]))
+        text_story.append(Spacer(1, 12))
+        text_story.append(Paragraph("Agenda", styles["Heading3"]))
         agenda_lines = agenda.split("\n")
         for line in agenda_lines:
-            story.append(Paragraph(line.strip(), styles["Normal"]))
-        story.append(Spacer(1, 12))
+            text_story.append(Paragraph(line.strip(), styles["Normal"]))
+        text_story.append(Spacer(1, 12))
 
         # Add attachment list
         pdf_files = []
-        attachment_page_count = 0
-        if not documents_df.empty:
-            meeting_docs = documents_df[documents_df["Timestamp"] == timestamp]
-            if meeting_docs.empty:
-                print(f"Warning: No documents found for {meeting_date} (Timestamp: {timestamp})")
+        if has_documents:
+            meeting_docs = docs_by_timestamp.get(timestamp)
+            if meeting_docs is None:
+                logger.warning(f"No documents found for {meeting_date} (Timestamp: {timestamp})")
             else:
-                story.append(Paragraph("Attachments", styles["Heading3"]))
-                for _, doc in meeting_docs.iterrows():
+                text_story.append(Paragraph("Attachments", styles["Heading3"]))
+                for doc in meeting_docs.to_dict("records"):
                     file_path = doc.get("File Path", "")
                     file_name = doc.get("File Name", "Unknown")
-                    if not os.path.exists(file_path):
-                        print(f"Warning: Attachment {file_path} not found for {meeting_date}")
+                    if _file_stat(file_path, dir_listings) is None:
+                        logger.warning(f"Attachment {file_path} not found for {meeting_date}")
                         continue
 
                     # Handle supported document formats or .pdf attachments
                     final_pdf_path = file_path
                     original_file_name = file_name  # Preserve original name for display
-                    file_ext = os.path.splitext(file_path.lower())[1]
+                    file_ext = doc["Extension"]
                     if file_ext in SUPPORTED_DOC_EXTENSIONS:
-                        pdf_name = f"{os.path.splitext(os.path.basename(file_path))[0]}.pdf"
-                        final_pdf_path = os.path.join(attachments_dir, pdf_name)
-                        if not os.path.exists(final_pdf_path):
-                            if convert_doc_to_pdf(file_path, final_pdf_path):
-                                print(f"Converted {file_name} to PDF {final_pdf_path} for {meeting_date}")
+                        final_pdf_path = _attachment_pdf_path(file_path, attachments_dir)
+                        if file_path in conversion_results:
+                            if conversion_results[file_path]:
+                                logger.info(f"Converted {file_name} to PDF {final_pdf_path} for {meeting_date}")
                             else:
-                                print(f"Warning: Failed to convert {file_name} to PDF for {meeting_date}")
+                                logger.warning(f"Failed to convert {file_name} to PDF for {meeting_date}")
                                 continue
                         else:
-                            print(f"Using existing PDF {final_pdf_path} for {file_name}")
+                            logger.info(f"Using existing PDF {final_pdf_path} for {file_name}")
                         file_path = final_pdf_path
-                    elif file_ext != '.pdf':
-                        print(f"Warning: Skipping unsupported file format {file_name} (extension {file_ext}) for {meeting_date}")
+                    elif file_ext != 'pdf':
+                        logger.warning(f"Skipping unsupported file format {file_name} (extension '{file_ext}') for {meeting_date}")
                         continue
 
                     # Add original file name to the list
-                    story.append(Paragraph(f"Attachment: {original_file_name}", styles["Normal"]))
-                    story.append(Spacer(1, 6))
-
-                    # Add attachment PDF to merge list
-                    if os.path.exists(file_path):
-                        pdf_files.append(file_path)
-                        # Estimate page count
-                        try:
-                            result = subprocess.run(
-                                ["pdftk", file_path, "dump_data"],
-                                capture_output=True, text=True, check=True
-                            )
-                            for line in result.stdout.splitlines():
-                                if line.startswith("NumberOfPages"):
-                                    page_count = int(line.split(":")[1].strip())
-                                    attachment_page_count += page_count
-                                    print(f"Prepared {original_file_name} for {meeting_date} ({page_count} pages)")
-                                    break
-                        except Exception as e:
-                            print(f"Error reading {original_file_name} for page count: {e}")
-                    else:
-                        print(f"Warning: {original_file_name} not found at {file_path} for {meeting_date}")
+                    text_story.append(Paragraph(f"Attachment: {original_file_name}", styles["Normal"]))
+                    text_story.append(Spacer(1, 6))
 
-        # Generate text PDF for this meeting
-        meeting_text_pdf = os.path.join(tempfile.gettempdir(), f"meeting_{idx}.pdf")
-        meeting_doc = SimpleDocTemplate(meeting_text_pdf, pagesize=letter)
-        meeting_doc.build(story)
-        text_page_count = 0
-        try:
-            result = subprocess.run(
-                ["pdftk", meeting_text_pdf, "dump_data"],
-                capture_output=True, text=True, check=True
-            )
-            for line in result.stdout.splitlines():
-                if line.startswith("NumberOfPages"):
-                    text_page_count = int(line.split(":")[1].strip())
-                    break
-        except Exception as e:
-            print(f"Error reading text PDF page count for {meeting_date}: {e}")
-            text_page_count = 1  # Fallback estimate
-        print(f"Generated text PDF for {meeting_date} ({text_page_count} pages)")
-
-        # Merge meeting text PDF with its attachments
-        meeting_pdf = os.path.join(tempfile.gettempdir(), f"meeting_{idx}_full.pdf")
-        meeting_pdf_files = [meeting_text_pdf]
-        if pdf_files:
-            blank_page_pdf = os.path.join(tempfile.gettempdir(), "blank_page.pdf")
-            # Create a single blank page PDF with minimal content
-            blank_doc = SimpleDocTemplate(blank_page_pdf, pagesize=letter)
-            blank_doc.build([Paragraph("", styles["Normal"])])  # Empty paragraph
-            temp_files.append(blank_page_pdf)
-            for pdf_file in pdf_files:
-                meeting_pdf_files.append(blank_page_pdf)  # Add blank page for separation
-                meeting_pdf_files.append(pdf_file)
-
-        if len(meeting_pdf_files) == 1:  # Only text PDF, no attachments
-            meeting_pdf_files.append(meeting_text_pdf)  # Duplicate to avoid pdftk error
-        try:
-            subprocess.run(
-                ["pdftk"] + meeting_pdf_files + ["cat", "output", meeting_pdf],
-                check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-            )
-            meeting_pdfs.append(meeting_pdf)
-            temp_files.append(meeting_text_pdf)
-            temp_files.append(meeting_pdf)
-            print(f"Merged meeting PDF for {meeting_date} (text: {text_page_count}, attachments: {attachment_page_count} pages)")
-        except subprocess.CalledProcessError as e:
-            print(f"Error merging meeting PDF for {meeting_date}: {e.stderr}")
-            continue
-
-    # Merge all meeting PDFs into the final report
+                    # Add attachment PDF to merge list; page counts are read in one batch below
+                    if _file_stat(file_path, dir_listings) is not None:
+                        pdf_files.append((file_path, original_file_name))
+                    else:
+                        logger.warning(f"{original_file_name} not found at {file_path} for {meeting_date}")
+
+        text_story.append(_PageMarker(text_page_ends))
+        meeting_sections.append((meeting_date, pdf_files))
+
+    # Generate the text PDF for all meetings in a single build
+    meetings_text_pdf = os.path.join(tempfile.gettempdir(), "meetings_text.pdf")
+    meetings_doc = SimpleDocTemplate(meetings_text_pdf, pagesize=letter)
+    wait([page_build])  # Any build error is raised at the merge below
+    meetings_doc.build(text_story)
+    temp_files.append(meetings_text_pdf)
+
+    # Queue each meeting's text pages followed by its attachments for the single final merge
+    attachment_pdfs = {}
+    text_page_start = 0
+    for (meeting_date, pdf_files), text_page_end in zip(meeting_sections, text_page_ends):
+        final_pdf_files.append((meetings_text_pdf, text_page_start, text_page_end))
+        attachment_page_count = 0
+        for pdf_file, original_file_name in pdf_files:
+            # Each attachment is opened once here; its page count comes from the same handle the merge reuses,
+            # and unreadable PDFs are left out so they cannot break the final merge
+            if pdf_file not in attachment_pdfs:
+                attachment_pdfs[pdf_file] = open_pdf_or_none(pdf_file)
+            attachment_pdf = attachment_pdfs[pdf_file]
+            if attachment_pdf is None:
+                logger.warning(f"Skipping unreadable {original_file_name} for {meeting_date}")
+                continue
+            page_count = len(attachment_pdf.pages)
+            attachment_page_count += page_count
+            logger.info(f"Prepared {original_file_name} for {meeting_date} ({page_count} pages)")
+            final_pdf_files.append(blank_page_pdf)  # Add blank page for separation
+            final_pdf_files.append(pdf_file)
+        logger.info(f"Prepared meeting PDF for {meeting_date} (text: {text_page_end - text_page_start}, attachments: {attachment_page_count} pages)")
+        text_page_start = text_page_end
+
+    # Merge the title page, every meeting and its attachments into the final report in one pass
     try:
-        # Merge all PDFs with pdftk
-        final_pdf_files = [title_pdf] + meeting_pdfs
-        subprocess.run(
-            ["pdftk"] + final_pdf_files + ["cat", "output", output_pdf],
-            check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        # Surface any error from the background title and blank page build, then merge all PDFs with pikepdf
+        page_build.result()
+        merge_pdfs(
+            final_pdf_files, output_pdf,
+            sources={path: pdf for path, pdf in attachment_pdfs.items() if pdf is not None}
         )
 
         # Get final page count
         try:
-            result = subprocess.run(
-                ["pdftk", output_pdf, "dump_data"],
-                capture_output=True, text=True, check=True
-            )
-            final_page_count = 0
-            for line in result.stdout.splitlines():
-                if line.startswith("NumberOfPages"):
-                    final_page_count = int(line.split(":")[1].strip())
-                    break
-            print(f"Generated {output_pdf} successfully (total pages: {final_page_count})")
+            final_page_count = count_pdf_pages(output_pdf)
+            logger.info(f"Generated {output_pdf} successfully (total pages: {final_page_count})")
         except Exception as e:
-            print(f"Error reading final PDF page count: {e}")
-            print(f"Generated {output_pdf} successfully")
+            logger.error(f"Error reading final PDF page count: {e}")
+            logger.info(f"Generated {output_pdf} successfully")
 
         # Clean up temporary PDFs
         for temp_file in temp_files:
             if os.path.exists(temp_file):
                 try:
                     os.remove(temp_file)
-                    print(f"Cleaned up temporary PDF {temp_file}")
+                    logger.info(f"Cleaned up temporary PDF {temp_file}")
                 except Exception as e:
-                    print(f"Error cleaning up {temp_file}: {e}")
-    except subprocess.CalledProcessError as e:
-        print(f"Error merging final PDF: {e.stderr}")
+                    logger.error(f"Error cleaning up {temp_file}: {e}")
+    except pikepdf.PdfError as e:
+        logger.error(f"Error merging final PDF: {e}")
     except Exception as e:
-        print(f"Error generating PDF {output_pdf}: {e}")
+        logger.error(f"Error generating PDF {output_pdf}: {e}")
+
+def setup_logging():
+    """
+    Send log records through a queue to a single background writer.
+
+    Conversion and page-build worker threads only enqueue records, so they never
+    block on console writes.
+
+    Returns:
+        logging.handlers.QueueListener: The started listener; stop it to flush pending records.
+    """
+    log_queue = queue.SimpleQueue()
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, console_handler)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    return listener
 
 def main():
-    generate_yearly_report(board_name, year, data_dir)
+    listener = setup_logging()
+    try:
+        generate_yearly_report(board_name, year, data_dir)
+    finally:
+        listener.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,352 +1,630 @@
 #!/usr/bin/env python3
 
 import os
+import csv
 import logging
 import pandas as pd
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 import time
-import datetime
 import sys
-from mytowngov_common import load_config, setup_driver, fetch_page, capture_screenshot, Cache, has_iframe
+import re
+import queue
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree
+from mytowngov_common import (
+    load_config, setup_driver, fetch_page, capture_screenshot, Cache, has_iframe, element_text,
+    scroll_to_load, write_debug_html, write_error_html, parse_html, page_snapshot, CONTENT_FRAME_SRC_XPATH
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Every candidate for the board name in one union, so the page is searched once instead of per selector
+BOARD_NAME_XPATH = (
+    "//h1"
+    " | //*[contains(@class, 'board-title')]"
+    " | //*[contains(text(), 'Planning Board')]"
+    " | //*[contains(@class, 'board-name')]"
+)
+
+# Case-insensitive text() for XPath 1.0, which has no lower-case()
+_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_LOWER = "abcdefghijklmnopqrstuvwxyz"
+_LOWER_TEXT = f"translate(text(), '{_UPPER}', '{_LOWER}')"
+
+# Every meetings section heading in one query; a union returns each matching node only once
+MEETING_HEADINGS_XPATH = (
+    f"//*[contains({_LOWER_TEXT}, 'past meetings')"
+    f" or contains({_LOWER_TEXT}, 'upcoming meetings')"
+    f" or (self::h4 and contains({_LOWER_TEXT}, 'meetings'))"
+    f" or contains(text(), 'Meetings')]"
+)
+
+MEMBERS_XPATH = "//*[contains(text(), 'Members:')]"
+
+NAME_CANDIDATES_JS = "return arguments[0].map(e => [e.tagName.toLowerCase(), e.innerText]);"
+
+# 64-bit fingerprint of the current document computed in the browser, so an unchanged board is
+# recognised without pulling the whole page source over the WebDriver bridge
+PAGE_HASH_JS = """
+var s = document.documentElement.outerHTML, h1 = 0xdeadbeef, h2 = 0x41c6ce57;
+for (var i = 0; i < s.length; i++) {
+    var ch = s.charCodeAt(i);
+    h1 = Math.imul(h1 ^ ch, 2654435761);
+    h2 = Math.imul(h2 ^ ch, 1597334677);
+}
+h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489917);
+h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489917);
+return s.length.toString(16) + '-' + ('0000000' + (h2 >>> 0).toString(16)).slice(-8)
+    + ('0000000' + (h1 >>> 0).toString(16)).slice(-8);
+"""
+
+# Compiled once and evaluated against an lxml snapshot of the page instead of over the WebDriver bridge
+_XP_BOARD_NAME = etree.XPath(BOARD_NAME_XPATH)
+_XP_MEETING_HEADINGS = etree.XPath(MEETING_HEADINGS_XPATH)
+_XP_NEXT_TABLE = etree.XPath("following::table[1]")
+# Only the first members section, clerk field and details link are read, so those searches stop at the first match
+_XP_MEMBERS = etree.XPath(f"({MEMBERS_XPATH})[1]")
+_XP_CLERK = etree.XPath("(//*[contains(text(), 'Clerk:')])[1]")
+_XP_DETAILS_HREF = etree.XPath("(.//a[contains(text(), 'Details and Agenda')])[1]/@href")
+
+# Member lines look like "Jane Doe, Chair"; the name is everything before the comma
+_CHAIR_RE = re.compile(r'^(.*?),\s*Chair')
+_CLERK_RE = re.compile(r'^(.*?),\s*Clerk')
+
+# Trailing time zone abbreviation after AM/PM ("Sep 10, 2024 7:00 PM EDT"); the stored dates are naive local times
+_TZ_SUFFIX_RE = re.compile(r"(?<=[AP]M)\s+[A-Z]{2,5}$")
+
+# Meeting date formats seen on board pages, most common first, each paired with the shape of
+# string it can match so a format is only tried on rows that could possibly parse with it
+_TEXT_DATE_TIME = re.compile(r"^[A-Za-z]+ \d{1,2}, \d{4} .*:")
+DATE_FORMATS = (
+    ("%b %d, %Y %I:%M %p", _TEXT_DATE_TIME),
+    ("%B %d, %Y %I:%M %p", _TEXT_DATE_TIME),
+    ("%Y-%m-%d %H:%M:%S", re.compile(r"^\d{4}-\d{2}-\d{2} ")),
+    ("%b %d, %Y", re.compile(r"^[A-Za-z]+ \d{1,2}, \d{4}$")),
+)
+
+# Wait for content every board page must have
+PAGE_TIMEOUT = 15
+STATIC_FETCH_TIMEOUT = 10
+# Boards read over plain HTTP only wait on the network, so many more of them run at once than browsers
+STATIC_FETCH_WORKERS = 8
+
 class BoardScraper:
-    def __init__(self, config_path='config.yaml', headless=True, bypass_cache=True):
+    # Failure pages kept per run; a systematic failure would otherwise write one for every board
+    MAX_ERROR_PAGES = 5
+
+    def __init__(self, config_path='config.yaml', headless=True, bypass_cache=True, driver=None):
         self.config = load_config(config_path)
         self.base_url = self.config['base_url']
         self.data_dir = self.config['data_dir']
         self.use_cache = self.config.get('use_cache', True)
         self.cache = Cache(self.config)
-        self.driver = setup_driver(headless=headless)
-        self.wait = WebDriverWait(self.driver, 15)
+        self.headless = headless
+        self._driver = driver
+        self._owns_driver = driver is None
+        # Boards are independent pages, so several browsers can scrape them side by side
+        self.parallel_boards = max(1, int(self.config.get('parallel_boards', 1)))
+        self.extra_drivers = []
         self.screenshots_enabled = self.config.get('screenshots', {}).get('enabled', True)
+        # Photograph only the boards whose scrape went wrong instead of every board
+        self.screenshots_on_failure_only = self.config.get('screenshots', {}).get('on_failure_only', True)
         self.focus_mode = self.config.get('focus_mode_boards', False)
         self.focus_board = self.config.get('focus_board', None)
         self.bypass_cache = bypass_cache
-
-    def _log_page_state(self, context="unknown"):
+        # Page snapshots on the success path are only worth their disk space while debugging
+        self.save_debug_html = self.config.get('debug', False)
+        self.error_pages_saved = 0
+        self._error_pages_lock = threading.Lock()
+        # Which drivers are currently inside the content frame, so redundant switches can be skipped
+        self._in_content_frame = {}
+        # Keep-alive connections for boards read without the browser; requests.Session isn't
+        # thread-safe, so each board worker thread gets its own
+        self._thread_state = threading.local()
+        self._sessions = []
+
+    def _enter_content_frame(self, driver):
+        if self._in_content_frame.get(driver):
+            return True
+        try:
+            driver.switch_to.frame("content")
+        except Exception as e:
+            logger.warning(f"Failed to switch to content iframe: {e}")
+            return False
+        self._in_content_frame[driver] = True
+        logger.debug("Switched to content iframe")
+        return True
+
+    def _leave_content_frame(self, driver):
+        if not self._in_content_frame.get(driver):
+            return
+        try:
+            driver.switch_to.default_content()
+            logger.debug("Switched back to default content")
+        except Exception as e:
+            logger.error(f"Error switching back to default content: {e}")
+        self._in_content_frame[driver] = False
+
+    @property
+    def driver(self):
+        # Chrome only starts once a board needs it, so a run served entirely over HTTP never launches it
+        if self._driver is None:
+            self._driver = setup_driver(
+                headless=self.headless, debugger_address=self.config.get('browser_debugger_address'),
+                block_media=not self.screenshots_enabled
+            )
+        return self._driver
+
+    def _session(self):
+        session = getattr(self._thread_state, 'session', None)
+        if session is None:
+            session = requests.Session()
+            self._thread_state.session = session
+            self._sessions.append(session)
+        return session
+
+    def _claim_error_page(self):
+        # Board workers share the per-run cap on failure pages
+        with self._error_pages_lock:
+            if self.error_pages_saved >= self.MAX_ERROR_PAGES:
+                return False
+            self.error_pages_saved += 1
+            return True
+
+    def _log_page_state(self, driver, context="unknown", failed=False):
+        # Every line below costs a WebDriver round trip, so skip them all unless they will be logged
+        if not logger.isEnabledFor(logging.DEBUG):
+            # A failure still gets the one round trip that says which page it happened on
+            if failed:
+                try:
+                    logger.info(f"Page at failure ({context}): {driver.current_url}")
+                except Exception as e:
+                    logger.error(f"Error logging page URL: {e}")
+            return
         try:
             logger.debug(f"Logging page state ({context})")
-            logger.debug(f"Current URL: {self.driver.current_url}")
-            logger.debug(f"Page title: {self.driver.title}")
-            page_content = self.driver.page_source[:1000]
+            logger.debug(f"Current URL: {driver.current_url}")
+            logger.debug(f"Page title: {driver.title}")
+            # Slice in the browser so only the logged prefix crosses the WebDriver bridge
+            page_content = driver.execute_script("return document.documentElement.outerHTML.substring(0, 1000)")
             logger.debug(f"Page content (first 1000 chars): {page_content}")
         except Exception as e:
             logger.error(f"Error logging page state: {e}")
 
-    def _scrape_board_details(self):
+    def _scrape_board_details(self, driver):
         details = {'name': '', 'chair': '', 'clerk': ''}
+        wait = WebDriverWait(driver, PAGE_TIMEOUT)
         try:
-            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, 'body')))
-            time.sleep(1)
-
-            selectors = [
-                (By.TAG_NAME, 'h1'),
-                (By.XPATH, "//h1"),
-                (By.XPATH, "//*[contains(@class, 'board-title')]"),
-                (By.XPATH, "//*[contains(text(), 'Planning Board')]"),
-                (By.XPATH, "//*[contains(@class, 'board-name')]")
-            ]
-            name_element = None
-            for by, value in selectors:
-                try:
-                    name_element = self.wait.until(EC.visibility_of_element_located((by, value)))
-                    details['name'] = name_element.text.strip()
-                    logger.debug(f"Found board name using {by}='{value}': {details['name']}")
-                    break
-                except TimeoutException:
-                    logger.debug(f"Selector {by}='{value}' failed to find board name")
+            wait.until(EC.presence_of_element_located((By.TAG_NAME, 'body')))
+
+            try:
+                name_elements = wait.until(EC.visibility_of_any_elements_located((By.XPATH, BOARD_NAME_XPATH)))
+                # Tag and rendered text of every visible candidate in one call instead of two per element
+                candidates = driver.execute_script(NAME_CANDIDATES_JS, name_elements)
+                # The union comes back in document order; keep preferring the page heading when there is one
+                name_tag, name_text = next((c for c in candidates if c[0] == 'h1'), candidates[0])
+                details['name'] = name_text.strip()
+                logger.debug(f"Found board name in <{name_tag}>: {details['name']}")
+            except TimeoutException:
+                logger.debug("Board name selectors failed to find a visible element")
 
             if not details['name']:
                 logger.error("Could not find board name with any selector")
-                return details
-
-            try:
-                members_section = self.driver.find_element(By.XPATH, "//*[contains(text(), 'Members:')]")
-                members_text = members_section.text.strip()
-                logger.debug(f"Found members section: {members_text}")
-
-                members_lines = members_text.split('\n')
-                for line in members_lines:
-                    if "Chair" in line:
-                        chair_name = line.split(', Chair')[0].strip()
-                        details['chair'] = chair_name
-                        logger.debug(f"Found chair: {details['chair']}")
-                    if "Clerk" in line:
-                        clerk_name = line.split(', Clerk')[0].strip()
-                        details['clerk'] = clerk_name
-                        logger.debug(f"Found clerk: {details['clerk']}")
-                    if not details['clerk']:
-                        try:
-                            clerk_element = self.driver.find_element(By.XPATH, "//*[contains(text(), 'Clerk:')]")
-                            clerk_text = clerk_element.text.strip()
-                            details['clerk'] = clerk_text.replace('Clerk:', '').strip()
-                            logger.debug(f"Found clerk from Clerk field: {details['clerk']}")
-                        except NoSuchElementException:
-                            logger.debug("Clerk field not found")
-
-            except NoSuchElementException:
-                logger.warning("Members section not found, skipping chair and clerk extraction")
 
         except TimeoutException as e:
             logger.error(f"Error scraping board details: {e}")
-            self._log_page_state("after board details failure")
+            self._log_page_state(driver, "after board details failure", failed=True)
         except Exception as e:
             logger.error(f"Unexpected error scraping board details: {e}")
-            self._log_page_state("after unexpected board details failure")
+            self._log_page_state(driver, "after unexpected board details failure", failed=True)
         return details
 
-    def _parse_date(self, date_str):
-        try:
-            date_str = date_str.replace('\n', ' ').strip()
-            formats = [
-                "%b %d, %Y %I:%M %p %Z",
-                "%b %d, %Y %I:%M %p",
-                "%B %d, %Y %I:%M %p",
-                "%Y-%m-%d %H:%M:%S",
-                "%b %d, %Y"
-            ]
-            for fmt in formats:
-                try:
-                    return datetime.datetime.strptime(date_str, fmt)
-                except ValueError:
-                    continue
-            logger.error(f"Could not parse date '{date_str}' with any format")
-            return None
-        except Exception as e:
-            logger.error(f"Error parsing date '{date_str}': {e}")
+    def _parse_board_name(self, tree):
+        # Same preference as the live page: the page heading first, then the first other candidate with text
+        candidates = [el for el in _XP_BOARD_NAME(tree) if element_text(el)]
+        if not candidates:
+            return ''
+        name_element = next((el for el in candidates if el.tag == 'h1'), candidates[0])
+        return element_text(name_element)
+
+    def _parse_board_members(self, tree, details):
+        members_sections = _XP_MEMBERS(tree)
+        if not members_sections:
+            logger.warning("Members section not found, skipping chair and clerk extraction")
+            return
+
+        members_text = element_text(members_sections[0])
+        logger.debug(f"Found members section: {members_text}")
+
+        for line in members_text.split('\n'):
+            chair_match = _CHAIR_RE.match(line)
+            if chair_match:
+                details['chair'] = chair_match.group(1).strip()
+                logger.debug(f"Found chair: {details['chair']}")
+            clerk_match = _CLERK_RE.match(line)
+            if clerk_match:
+                details['clerk'] = clerk_match.group(1).strip()
+                logger.debug(f"Found clerk: {details['clerk']}")
+
+        # Fall back to a separate "Clerk:" field only when no member is listed as clerk
+        if not details['clerk']:
+            clerk_elements = _XP_CLERK(tree)
+            if clerk_elements:
+                clerk_text = element_text(clerk_elements[0])
+                details['clerk'] = clerk_text.replace('Clerk:', '').strip()
+                logger.debug(f"Found clerk from Clerk field: {details['clerk']}")
+            else:
+                logger.debug("Clerk field not found")
+
+    def _parse_meeting_dates(self, meetings):
+        # Parse every raw date string with one vectorized pass per format; rows that match none are dropped
+        if not meetings:
+            return meetings
+
+        date_strs = (
+            pd.Series([meeting["date"] for meeting in meetings], dtype="object")
+            .str.replace("\n", " ", regex=False)
+            .str.strip()
+            .str.replace(_TZ_SUFFIX_RE, "", regex=True)
+        )
+        parsed = pd.Series(pd.NaT, index=date_strs.index, dtype="datetime64[ns]")
+        for fmt, shape in DATE_FORMATS:
+            pending = parsed.isna()
+            if not pending.any():
+                break
+            candidates = pending & date_strs.str.contains(shape, regex=True, na=False)
+            if candidates.any():
+                parsed[candidates] = pd.to_datetime(date_strs[candidates], format=fmt, errors="coerce")
+
+        # Convert the whole column to datetime objects at once rather than boxing a Timestamp per row;
+        # numpy turns NaT into None
+        py_dates = parsed.to_numpy().astype("datetime64[us]").tolist()
+        parsed_meetings = []
+        for meeting, date in zip(meetings, py_dates):
+            if date is None:
+                logger.warning(f"Failed to parse date '{meeting['date']}' for {meeting['board_name']}")
+                continue
+            meeting["date"] = date
+            parsed_meetings.append(meeting)
+        return parsed_meetings
+
+    def _meeting_from_row(self, row, idx, board_name):
+        cells = list(row.iter("td"))
+        logger.debug(f"Row {idx} has {len(cells)} cells")
+
+        if len(cells) >= 5:  # Past Meetings
+            date_str = element_text(cells[0])
+            location = element_text(cells[1])
+            minutes = element_text(cells[2])
+            other_docs = element_text(cells[3])
+            details_cell = cells[4]
+        elif len(cells) >= 4:  # Upcoming Meetings
+            date_str = element_text(cells[1])
+            location = element_text(cells[2])
+            minutes = ""
+            other_docs = ""
+            details_cell = cells[3]
+        else:
+            logger.warning(f"Row {idx} has insufficient cells ({len(cells)})")
             return None
 
-    def _scrape_meetings(self, board_name):
+        # The href comes back as a plain string, without building an element for the link
+        details_hrefs = _XP_DETAILS_HREF(details_cell)
+        if details_hrefs:
+            details_url = str(details_hrefs[0])
+        else:
+            details_url = ""
+            logger.debug(f"Row {idx}: No 'Details and Agenda' link found")
+
+        meeting = {
+            "board_name": board_name,
+            "date": date_str,  # Parsed for all rows at once by the caller
+            "location": location,
+            "status": "Cancelled" if "Cancelled" in location else "Scheduled",
+            "details_url": details_url,
+            "minutes": minutes,
+            "other_docs": other_docs
+        }
+        if len(cells) < 5:
+            meeting["row_board_name"] = element_text(cells[0])
+        return meeting
+
+    def _parse_meetings(self, tree, board_name):
+        # Meeting rows from a parsed page or content frame; dates are left as the raw strings
         meetings = []
+        # Every row belongs to this board, so the key only needs to tell its meetings apart
         seen_meetings = set()
+        headings = []
         try:
-            iframe_exists = has_iframe(self.driver, "content")
-            if iframe_exists:
-                try:
-                    self.driver.switch_to.frame("content")
-                    logger.debug("Switched to content iframe for meetings")
-                except Exception as e:
-                    logger.warning(f"Failed to switch to content iframe: {e}")
-                    iframe_exists = False
-
-            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, 'body')))
-            time.sleep(2)
+            headings = _XP_MEETING_HEADINGS(tree)
+            logger.debug(f"Found {len(headings)} meetings section headings")
+        except Exception as e:
+            logger.debug(f"Meetings heading search failed: {e}")
 
-            logger.debug("Scrolling to load content")
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-            for _ in range(3):  # Reduced iterations
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)  # Reduced wait time
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
-                    break
-                last_height = new_height
-            logger.debug(f"Final scroll height: {last_height}")
+        if not headings:
+            logger.warning("No meetings sections found, checking for tables")
+            try:
+                tables = list(tree.iter("table"))
+                if tables:
+                    logger.debug(f"Found {len(tables)} tables as fallback")
+                    headings = tables
+            except Exception as e:
+                logger.error(f"Error finding fallback tables: {e}")
 
-            debug_path = os.path.join(self.data_dir, board_name, "debug", f"meetings_page_{int(time.time())}.html")
-            os.makedirs(os.path.dirname(debug_path), exist_ok=True)
-            with open(debug_path, "w", encoding="utf-8") as f:
-                f.write(self.driver.page_source)
-            logger.info(f"Saved meetings page HTML: {debug_path}")
-
-            selectors = [
-                (By.XPATH, "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'past meetings')]"),
-                (By.XPATH, "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'upcoming meetings')]"),
-                (By.XPATH, "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'planning board upcoming meetings')]"),
-                (By.XPATH, "//h4[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'meetings')]"),
-                (By.XPATH, "//*[contains(text(), 'Meetings')]")
-            ]
-            headings = []
-            for by, value in selectors:
-                try:
-                    elements = self.driver.find_elements(by, value)
-                    logger.debug(f"Found {len(elements)} elements using {by}='{value}'")
-                    headings.extend(elements)
-                except Exception as e:
-                    logger.debug(f"Selector {by}='{value}' failed: {e}")
+        if not headings:
+            logger.warning("No meetings sections or tables found")
+            return meetings
 
-            if not headings:
-                logger.warning("No meetings sections found, checking for tables")
-                try:
-                    tables = self.driver.find_elements(By.TAG_NAME, "table")
-                    if tables:
-                        logger.debug(f"Found {len(tables)} tables as fallback")
-                        headings = tables
-                except Exception as e:
-                    logger.error(f"Error finding fallback tables: {e}")
+        for heading in headings:
+            try:
+                heading_text = element_text(heading) or "Unnamed Section"
+                logger.info(f"Processing meetings section: {heading_text}")
+
+                following_tables = _XP_NEXT_TABLE(heading)
+                if following_tables:
+                    table = following_tables[0]
+                else:
+                    table = heading if heading.tag == "table" else None
+                if table is None:
+                    logger.debug(f"No table found for section '{heading_text}'")
+                    continue
 
-            if not headings:
-                logger.warning("No meetings sections or tables found")
-                self._log_page_state("after failing to find Meetings section")
-                return meetings
+                logger.debug(f"Found table for section '{heading_text}'")
+                rows = list(table.iter("tr"))[1:]
+                logger.debug(f"Found {len(rows)} meeting rows in section '{heading_text}'")
 
-            for heading in headings:
-                try:
-                    heading_text = heading.text.strip() if heading.text else "Unnamed Section"
-                    logger.info(f"Processing meetings section: {heading_text}")
-
-                    try:
-                        table = heading.find_element(By.XPATH, "following::table[1]")
-                    except NoSuchElementException:
-                        table = heading if heading.tag_name == "table" else None
-                    if not table:
-                        logger.debug(f"No table found for section '{heading_text}'")
+                # Rows come from a parsed snapshot, so nothing can go stale mid-loop, and _meeting_from_row
+                # checks the cell count before touching any cell; a bad section is still caught below
+                for idx, row in enumerate(rows):
+                    meeting = self._meeting_from_row(row, idx, board_name)
+                    if meeting is None:
                         continue
+                    # A meeting's details page identifies it; rows without one fall back to their date
+                    meeting_key = meeting["details_url"] or meeting["date"]
+                    if meeting_key not in seen_meetings:
+                        seen_meetings.add(meeting_key)
+                        meetings.append(meeting)
+                        logger.info(
+                            f"Scraped meeting: {board_name}, {meeting['date']}, {meeting['location']}, "
+                            f"{meeting['status']}, {meeting['details_url']}"
+                        )
 
-                    logger.debug(f"Found table for section '{heading_text}'")
-                    rows = table.find_elements(By.TAG_NAME, "tr")[1:]
-                    logger.debug(f"Found {len(rows)} meeting rows in section '{heading_text}'")
-
-                    for idx, row in enumerate(rows):
-                        try:
-                            cells = row.find_elements(By.TAG_NAME, "td")
-                            logger.debug(f"Row {idx} has {len(cells)} cells")
-
-                            if len(cells) >= 5:  # Past Meetings
-                                date_str = cells[0].text.strip()
-                                location = cells[1].text.strip()
-                                minutes = cells[2].text.strip()
-                                other_docs = cells[3].text.strip()
-                                details_cell = cells[4]
-                            elif len(cells) >= 4:  # Upcoming Meetings
-                                row_board_name = cells[0].text.strip()
-                                date_str = cells[1].text.strip()
-                                location = cells[2].text.strip()
-                                minutes = ""
-                                other_docs = ""
-                                details_cell = cells[3]
-                            else:
-                                logger.warning(f"Row {idx} has insufficient cells ({len(cells)})")
-                                continue
-
-                            try:
-                                details_link = details_cell.find_element(By.XPATH, ".//a[contains(text(), 'Details and Agenda')]")
-                                details_url = details_link.get_attribute("href")
-                            except NoSuchElementException:
-                                details_url = ""
-                                logger.debug(f"Row {idx}: No 'Details and Agenda' link found")
-
-                            date = self._parse_date(date_str)
-                            if not date:
-                                logger.warning(f"Row {idx}: Failed to parse date '{date_str}'")
-                                continue
-
-                            status = "Cancelled" if "Cancelled" in location else "Scheduled"
-                            meeting_key = (board_name, date_str, details_url)
-                            if meeting_key not in seen_meetings:
-                                seen_meetings.add(meeting_key)
-                                meeting_data = {
-                                    "board_name": board_name,
-                                    "date": date,
-                                    "location": location,
-                                    "status": status,
-                                    "details_url": details_url,
-                                    "minutes": minutes,
-                                    "other_docs": other_docs
-                                }
-                                if len(cells) >= 4 and len(cells) < 5:
-                                    meeting_data["row_board_name"] = row_board_name
-                                meetings.append(meeting_data)
-                                logger.info(f"Scraped meeting: {board_name}, {date_str}, {location}, {status}, {details_url}")
-                        except Exception as e:
-                            logger.error(f"Error processing row {idx} in section '{heading_text}': {e}")
-                            continue
+            except Exception as e:
+                logger.error(f"Error parsing section '{heading_text}': {e}")
+                continue
 
-                except Exception as e:
-                    logger.error(f"Error parsing section '{heading_text}': {e}")
-                    continue
+        return meetings
+
+    def _scrape_meetings(self, driver, board_name, debug_dir, page_has_iframe, details):
+        meetings = []
+        page_source = None
+        try:
+            # Still inside the frame unless a screenshot has been taken since the details were read
+            if page_has_iframe:
+                self._enter_content_frame(driver)
+
+            # The scroll script waits for the frame's document to be ready before it starts
+            logger.debug("Scrolling to load content")
+            last_height = scroll_to_load(driver)
+            logger.debug(f"Final scroll height: {last_height}")
+
+            # Pull the rendered page across the bridge once; every lookup below runs on the parsed copy
+            page_source, base_url = page_snapshot(driver)
+            if self.save_debug_html:
+                debug_path = os.path.join(debug_dir, f"meetings_page_{int(time.time())}.html.gz")
+                write_debug_html(debug_path, page_source)
+                logger.info(f"Saved meetings page HTML: {debug_path}")
+            tree = parse_html(page_source, base_url)
+
+            # The members sit on the same page, so they come from this snapshot too rather than a second one
+            self._parse_board_members(tree, details)
+            meetings = self._parse_meetings(tree, board_name)
+            if not meetings:
+                self._log_page_state(driver, "after finding no meetings", failed=True)
 
         except Exception as e:
             logger.error(f"Error scraping meetings: {e}")
-            debug_path = os.path.join(self.data_dir, board_name, "debug", f"meetings_error_{int(time.time())}.html")
-            os.makedirs(os.path.dirname(debug_path), exist_ok=True)
-            with open(debug_path, "w", encoding="utf-8") as f:
-                f.write(self.driver.page_source)
-            logger.info(f"Saved debug HTML for meetings: {debug_path}")
-            self._log_page_state("after meetings scrape failure")
-        finally:
-            if iframe_exists:
-                try:
-                    self.driver.switch_to.default_content()
-                    logger.debug("Switched back to default content after meetings")
-                except Exception as e:
-                    logger.error(f"Error switching back to default content after meetings: {e}")
-
+            if self._claim_error_page():
+                debug_path = os.path.join(debug_dir, f"meetings_error_{int(time.time())}.html.gz")
+                # Reuse the snapshot taken after scrolling when the failure happened while parsing it
+                write_error_html(debug_path, driver, page_source)
+                logger.info(f"Saved debug HTML for meetings: {debug_path}")
+            self._log_page_state(driver, "after meetings scrape failure", failed=True)
+
+        meetings = self._parse_meeting_dates(meetings)
         logger.debug(f"Total meetings scraped: {len(meetings)}")
         return meetings
 
-    def scrape_board(self, board_name, board_url):
+    def _fetch_static(self, url):
+        response = self._session().get(url, timeout=STATIC_FETCH_TIMEOUT)
+        response.raise_for_status()
+        return response
+
+    def _scrape_board_static(self, board_name, board_url):
+        # Board pages are served as plain HTML, so without a screenshot to take the page and its
+        # content frame can be read over HTTP; None means the listings need the browser after all
+        try:
+            page_response = self._fetch_static(board_url)
+            tree = parse_html(page_response.text, page_response.url)
+            frame_srcs = tree.xpath(CONTENT_FRAME_SRC_XPATH)
+            frame_url = frame_srcs[0] if frame_srcs else None
+            frame_response = None
+            if frame_url:
+                frame_response = self._fetch_static(frame_url)
+                tree = parse_html(frame_response.text, frame_response.url)
+        except requests.RequestException as e:
+            logger.info(f"Static fetch failed for {board_url}, falling back to the browser: {e}")
+            return None
+        except (etree.ParserError, ValueError) as e:
+            # An empty or non-HTML response can't be parsed, but the browser may still render the page
+            logger.info(f"Static HTML for {board_url} could not be parsed, falling back to the browser: {e}")
+            return None
+
+        details = {'name': self._parse_board_name(tree), 'chair': '', 'clerk': ''}
+        if not details['name']:
+            logger.info(f"No board name in static HTML for {board_name}, falling back to the browser")
+            return None
+        meetings = self._parse_meetings(tree, board_name)
+        if not meetings:
+            logger.info(f"No meetings in static HTML for {board_name}, falling back to the browser")
+            return None
+
+        self._parse_board_members(tree, details)
+        logger.info(f"Board details: name={details['name']}, chair={details['chair']}, clerk={details['clerk']}")
+        meetings = self._parse_meeting_dates(meetings)
+        if meetings:
+            # The validators come from the responses just parsed, so the page isn't requested again
+            meeting_csv = os.path.join(self.data_dir, board_name, "board_meeting_data.csv")
+            self._save_meeting_csv(meeting_csv, meetings)
+            logger.info(f"Saved per-board meeting CSV for {board_name}: {meeting_csv}")
+            self.cache.store_validators(
+                board_url, page_response=page_response, frame_url=frame_url, frame_response=frame_response
+            )
+        return meetings
+
+    def _capture_failure_screenshot(self, driver, board_name, debug_dir):
+        if not (self.screenshots_enabled and self.screenshots_on_failure_only):
+            return
+        png_path, pdf_path = capture_screenshot(driver, debug_dir, self.config, prefix="board_error", board_name=board_name)
+        # capture_screenshot always hands the driver back at the top-level document
+        self._in_content_frame[driver] = False
+        if png_path and pdf_path:
+            logger.info(f"Saved failure screenshot for {board_name}: PNG={png_path}, PDF={pdf_path}")
+        else:
+            logger.error(f"Failed to save failure screenshot for {board_name}")
+
+    def _save_meeting_csv(self, meeting_csv, meetings):
+        # Columns in first-seen order; upcoming-meeting rows add row_board_name
+        fieldnames = list(dict.fromkeys(key for meeting in meetings for key in meeting))
+        with open(meeting_csv, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(meetings)
+
+    def _scrape_board_without_browser(self, board_name, board_url):
+        # The cache check and the plain HTTP path; None means the board needs the browser
         logger.info(f"Scraping board: {board_name}")
         board_dir = os.path.join(self.data_dir, board_name)
-        os.makedirs(board_dir, exist_ok=True)
+        # Creating the debug folder creates the board folder too; every later write reuses both
+        os.makedirs(os.path.join(board_dir, "debug"), exist_ok=True)
+        meeting_csv = os.path.join(board_dir, "board_meeting_data.csv")
+
+        # A page the server reports as unchanged since the last saved CSV needs no browser work at all
+        if not self.bypass_cache and os.path.exists(meeting_csv) and self.cache.is_unchanged(board_url):
+            logger.info(f"Board page for {board_name} unchanged since last scrape, keeping {meeting_csv}")
+            return pd.read_csv(meeting_csv).to_dict("records")
+
+        if not self.screenshots_enabled or self.screenshots_on_failure_only:
+            meetings = self._scrape_board_static(board_name, board_url)
+            if meetings:
+                logger.info(f"Scraped {len(meetings)} meetings for board {board_name} without the browser")
+                return meetings
+        return None
+
+    def scrape_board(self, board_name, board_url, get_driver=None, try_without_browser=True):
+        # get_driver is only called once the board turns out to need a browser
+        get_driver = get_driver or (lambda: self.driver)
+        if try_without_browser:
+            meetings = self._scrape_board_without_browser(board_name, board_url)
+            if meetings is not None:
+                return meetings
+        board_dir = os.path.join(self.data_dir, board_name)
+        debug_dir = os.path.join(board_dir, "debug")
+        meeting_csv = os.path.join(board_dir, "board_meeting_data.csv")
+        logger.info(f"Scraping board {board_name} in the browser")
 
-        content = fetch_page(self.driver, board_url, self.cache, bypass_cache=self.bypass_cache)
+        # The details and meetings are read from the live page, so the driver always has to load it
+        driver = get_driver()
+        content = fetch_page(driver, board_url, self.cache, bypass_cache=True, save_debug_html=self.save_debug_html)
+        # Loading a page always puts the driver back at the top-level document
+        self._in_content_frame[driver] = False
 
-        current_url = self.driver.current_url
+        current_url = driver.current_url
         if 'data:,' in current_url:
             logger.error(f"Page failed to load properly for {board_url}, current URL: {current_url}")
             raise Exception("Page load failed, invalid URL detected")
 
-        iframe_exists = has_iframe(self.driver, "content")
-        if iframe_exists:
-            try:
-                self.driver.switch_to.frame("content")
-                logger.debug("Switched to content iframe")
-            except Exception as e:
-                logger.error(f"Failed to switch to content iframe: {e}")
-                iframe_exists = False
+        # Checked once per page load and handed to the meetings step instead of querying the DOM again
+        page_has_iframe = has_iframe(driver, "content")
+        if page_has_iframe:
+            self._enter_content_frame(driver)
         else:
             logger.warning("No content iframe found")
 
-        self._log_page_state("after loading board page")
+        self._log_page_state(driver, "after loading board page")
 
-        details = self._scrape_board_details()
+        details = self._scrape_board_details(driver)
         if not details['name']:
             logger.error("Failed to scrape board details, aborting further scraping")
+            if self._claim_error_page():
+                debug_path = os.path.join(debug_dir, f"board_error_{int(time.time())}.html.gz")
+                write_error_html(debug_path, driver)
+                logger.info(f"Saved debug HTML for board details failure: {debug_path}")
+                self._capture_failure_screenshot(driver, board_name, debug_dir)
             raise Exception("Board name not found, cannot proceed with scraping")
 
-        logger.info(f"Board details: name={details['name']}, chair={details['chair']}, clerk={details['clerk']}")
-
-        debug_path = os.path.join(board_dir, "debug", f"board_{board_name}_{int(time.time())}.html")
-        os.makedirs(os.path.dirname(debug_path), exist_ok=True)
-        with open(debug_path, "w", encoding="utf-8") as f:
-            f.write(self.driver.page_source)
-        logger.info(f"Saved board debug HTML: {debug_path}")
-
-        if self.screenshots_enabled:
+        # Fingerprint the rendered page so an unchanged board skips the screenshot and debug dump. The meetings
+        # are always saved: rows that only load on scroll arrive after this point and aren't covered by it.
+        page_hash = driver.execute_script(PAGE_HASH_JS)
+        page_hash_path = os.path.join(board_dir, "board_page.hash")
+        previous_hash = None
+        if os.path.exists(page_hash_path):
+            with open(page_hash_path, "r", encoding="utf-8") as f:
+                previous_hash = f.read().strip()
+        page_unchanged = page_hash == previous_hash
+        # Only remember this fingerprint if everything derived from the page was saved
+        page_outputs_saved = True
+
+        # An unchanged fingerprint means this is byte-for-byte the page the last saved run saw
+        if self.save_debug_html and not page_unchanged:
+            debug_path = os.path.join(debug_dir, f"board_{board_name}_{int(time.time())}.html.gz")
+            write_debug_html(debug_path, driver.page_source)
+            logger.info(f"Saved board debug HTML: {debug_path}")
+
+        safe_board_name = board_name.replace(" ", "_").replace("/", "_")
+        screenshot_png = os.path.join(board_dir, f"board_{safe_board_name}.png")
+        screenshot_every_board = self.screenshots_enabled and not self.screenshots_on_failure_only
+        if screenshot_every_board and page_unchanged and os.path.exists(screenshot_png):
+            logger.info(f"Board page unchanged, keeping existing screenshot: {screenshot_png}")
+        elif screenshot_every_board:
             wait_selector = (By.TAG_NAME, "h1")
             png_path, pdf_path = capture_screenshot(
-                self.driver, board_dir, self.config, prefix="board", board_name=board_name, wait_selector=wait_selector
+                driver, board_dir, self.config, prefix="board", board_name=board_name, wait_selector=wait_selector
             )
+            self._in_content_frame[driver] = False
             if png_path and pdf_path:
                 logger.info(f"Board screenshot saved: PNG={png_path}, PDF={pdf_path}")
             else:
                 logger.error("Failed to save board screenshot")
+                page_outputs_saved = False
 
-        meetings = self._scrape_meetings(board_name)
+        meetings = self._scrape_meetings(driver, board_name, debug_dir, page_has_iframe, details)
+        logger.info(f"Board details: name={details['name']}, chair={details['chair']}, clerk={details['clerk']}")
         logger.info(f"Scraped {len(meetings)} meetings for board {board_name}")
 
         if meetings:
-            df_meetings = pd.DataFrame(meetings)
-            meeting_csv = os.path.join(board_dir, "board_meeting_data.csv")
-            os.makedirs(os.path.dirname(meeting_csv), exist_ok=True)
-            df_meetings.to_csv(meeting_csv, index=False)
+            self._save_meeting_csv(meeting_csv, meetings)
             logger.info(f"Saved per-board meeting CSV for {board_name}: {meeting_csv}")
+            # Only record validators once the CSV matches this version of the page
+            self.cache.store_validators(board_url)
         else:
             logger.warning(f"No meetings to save for {board_name}")
+            page_outputs_saved = False
+            # Only claim a failure-page slot when a screenshot will actually be taken
+            if self.screenshots_enabled and self.screenshots_on_failure_only and self._claim_error_page():
+                self._capture_failure_screenshot(driver, board_name, debug_dir)
 
-        if iframe_exists:
-            try:
-                self.driver.switch_to.default_content()
-                logger.debug("Switched back to default content")
-            except Exception as e:
-                logger.error(f"Error switching back to default content: {e}")
+        if page_outputs_saved and not page_unchanged:
+            with open(page_hash_path, "w", encoding="utf-8") as f:
+                f.write(page_hash)
+
+        self._leave_content_frame(driver)
 
         return meetings
 
@@ -358,31 +636,90 @@ class BoardScraper:
             print(error_msg)
             sys.exit(1)
 
-        df = pd.read_csv(boards_csv)
-        for _, row in df.iterrows():
+        with open(boards_csv, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        if self.focus_mode:
+            logger.debug(f"Focus mode enabled, only scraping {self.focus_board} out of {len(rows)} boards")
+            rows = [row for row in rows if row['Name'] == self.focus_board]
+
+        boards = []
+        for row in rows:
             board_name = row['Name']
             board_url = row['URL']
 
-            if not isinstance(board_name, str) or pd.isna(board_name):
-                logger.warning(f"Skipping invalid board name: {board_name}")
+            if not board_name:
+                logger.warning(f"Skipping invalid board name: {board_name!r}")
                 continue
 
-            if self.focus_mode and board_name != self.focus_board:
-                logger.debug(f"Skipping board {board_name} (focus mode enabled for {self.focus_board})")
-                continue
+            boards.append((board_name, board_url))
+
+        # Run the browser-free checks for every board at once first; only the boards left over need a browser
+        if len(boards) > 1:
+            with ThreadPoolExecutor(max_workers=min(STATIC_FETCH_WORKERS, len(boards))) as executor:
+                results = list(executor.map(lambda board: self._scrape_board_without_browser(*board), boards))
+            boards = [board for board, meetings in zip(boards, results) if meetings is None]
+            try_without_browser = False
+        else:
+            try_without_browser = True
 
-            self.scrape_board(board_name, board_url)
+        # Each worker drives a whole Chrome instance, so don't run more of them than there are cores
+        worker_count = min(self.parallel_boards, len(boards), os.cpu_count() or 1)
+        if worker_count <= 1:
+            for board_name, board_url in boards:
+                self.scrape_board(board_name, board_url, try_without_browser=try_without_browser)
+        else:
+            self._scrape_boards_parallel(boards, worker_count, try_without_browser)
 
         logger.info("Board scraping completed successfully")
 
+    def _scrape_boards_parallel(self, boards, worker_count, try_without_browser=True):
+        # Each task borrows a browser from the pool for the length of one board and hands it back afterwards.
+        # Empty slots launch their browser the first time a board needs one.
+        idle_drivers = [driver for driver in [self._driver] + self.extra_drivers if driver is not None][:worker_count]
+        driver_pool = queue.Queue()
+        for driver in idle_drivers + [None] * (worker_count - len(idle_drivers)):
+            driver_pool.put(driver)
+
+        def scrape_with_pooled_driver(board_name, board_url):
+            borrowed = []
+
+            def borrow_driver():
+                driver = driver_pool.get()
+                if driver is None:
+                    driver = setup_driver(headless=self.headless, block_media=not self.screenshots_enabled)
+                    self.extra_drivers.append(driver)
+                borrowed.append(driver)
+                return driver
+
+            try:
+                return self.scrape_board(
+                    board_name, board_url, get_driver=borrow_driver, try_without_browser=try_without_browser
+                )
+            finally:
+                for driver in borrowed:
+                    driver_pool.put(driver)
+
+        logger.info(f"Scraping {len(boards)} boards with {worker_count} browsers")
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            futures = [executor.submit(scrape_with_pooled_driver, board_name, board_url) for board_name, board_url in boards]
+            for future in futures:
+                future.result()
+
     def close(self):
-        try:
-            self.driver.quit()
-        except Exception as e:
-            logger.error(f"Error closing driver: {e}")
+        # A driver handed in by the caller is theirs to quit
+        owned_drivers = ([self._driver] if self._owns_driver else []) + self.extra_drivers
+        for driver in owned_drivers:
+            if driver is None:
+                continue
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.error(f"Error closing driver: {e}")
+        for session in self._sessions:
+            session.close()
 
 def main():
-    scraper = BoardScraper(headless=True, bypass_cache=True)
+    scraper = BoardScraper(headless=True, bypass_cache=False)
     try:
         scraper.scrape()
     finally:
@@ -3,7 +3,11 @@ import os
 import yaml
 import logging
 import hashlib
+import json
+import re
 import time
+import tempfile
+import gzip
 from datetime import datetime, timedelta
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -14,6 +18,9 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from PIL import Image
 import img2pdf
 import requests
+import lxml.html
+from lxml import etree
+from urllib.parse import urljoin
 
 # Logging setup
 def setup_logging(config):
@@ -49,6 +56,13 @@ def load_config(config_path='config.yaml'):
     return config
 
 # Cache utilities
+# Section headings that show a cached page actually rendered its listings; one alternation
+# scans the (often large) cached HTML once instead of once per heading
+_MEANINGFUL_CONTENT_RE = re.compile(r'Past Meetings|Upcoming Meetings|Boards and Committees')
+
+# The frame that holds a board page's listings, found in its id on some pages and its name on others
+CONTENT_FRAME_SRC_XPATH = "//iframe[@id='content' or @name='content']/@src"
+
 class Cache:
     def __init__(self, config):
         self.enabled = config.get('cache', {}).get('enabled', False)
@@ -76,18 +90,32 @@ class Cache:
         with open(cache_file, 'r', encoding='utf-8') as f:
             return f.read()
 
+    def _write_atomic(self, path, text):
+        # Scrapers run several boards at once against the same cache, so write to a private
+        # temp file and swap it in; readers only ever see a complete old or new entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
     def cache_content(self, url, content):
         if not self.enabled:
             return
         cache_file = self.cache_path(self.get_cache_key(url))
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        self._write_atomic(cache_file, content)
 
     def invalidate_cache(self, url):
+        logger = logging.getLogger(__name__)
         cache_file = self.cache_path(self.get_cache_key(url))
-        if os.path.exists(cache_file):
+        try:
             os.remove(cache_file)
             logger.info(f"Invalidated cache for {url}: {cache_file}")
+        except FileNotFoundError:
+            pass
 
     def is_valid_cached_content(self, url):
         if not self.is_cached(url):
@@ -97,25 +125,246 @@ class Cache:
             logger.warning(f"Cached content for {url} is empty or invalid, invalidating cache")
             self.invalidate_cache(url)
             return False
-        if "Past Meetings" not in content and "Upcoming Meetings" not in content and "Boards and Committees" not in content:
+        if not _MEANINGFUL_CONTENT_RE.search(content):
             logger.warning(f"Cached content for {url} lacks meaningful data, invalidating cache")
             self.invalidate_cache(url)
             return False
         return True
 
-# Iframe utilities
-def has_iframe(driver, iframe_name='content'):
-    try:
-        driver.find_element(By.ID, iframe_name)
-        return True
-    except:
+    def validators_path(self, url):
+        return self.cache_path(self.get_cache_key(url), ext='validators.json')
+
+    def _document_revision(self, url, previous=None):
+        # One conditional GET; a 304 or an identical body hash means the document is unchanged.
+        # The hash covers servers that send neither ETag nor Last-Modified.
+        headers = {}
+        if previous and 'etag' in previous:
+            headers['If-None-Match'] = previous['etag']
+        if previous and 'last_modified' in previous:
+            headers['If-Modified-Since'] = previous['last_modified']
+        response = requests.get(url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            return True, previous, None
+        response.raise_for_status()
+        revision = self._response_revision(response)
+        unchanged = bool(previous) and previous.get('sha256') == revision['sha256']
+        return unchanged, revision, response.text
+
+    def _response_revision(self, response):
+        revision = {'sha256': hashlib.sha256(response.content).hexdigest()}
+        if 'ETag' in response.headers:
+            revision['etag'] = response.headers['ETag']
+        if 'Last-Modified' in response.headers:
+            revision['last_modified'] = response.headers['Last-Modified']
+        return revision
+
+    def _page_revision(self, url, previous=None):
+        # Board pages are a shell around the "content" iframe that holds the listings,
+        # so the page only counts as unchanged when the frame document is unchanged too
+        previous = previous or {}
+        unchanged, page_revision, html = self._document_revision(url, previous.get('page'))
+        frame_url = previous.get('frame_url')
+        if html is not None:
+            frame_srcs = lxml.html.fromstring(html).xpath(CONTENT_FRAME_SRC_XPATH)
+            frame_url = urljoin(url, frame_srcs[0]) if frame_srcs else None
+        revision = {'page': page_revision, 'frame_url': frame_url}
+        if frame_url:
+            previous_frame = previous.get('frame') if frame_url == previous.get('frame_url') else None
+            frame_unchanged, revision['frame'], _ = self._document_revision(frame_url, previous_frame)
+            unchanged = unchanged and frame_unchanged
+        return unchanged, revision
+
+    def store_validators(self, url, page_response=None, frame_url=None, frame_response=None):
+        # Remember the page's validators so the next run can ask the server whether it changed.
+        # Callers that already downloaded the page and its content frame pass the responses in
+        if not self.enabled:
+            return
+        logger = logging.getLogger(__name__)
+        if page_response is not None:
+            revision = {'page': self._response_revision(page_response), 'frame_url': frame_url}
+            if frame_url:
+                revision['frame'] = self._response_revision(frame_response)
+        else:
+            try:
+                _, revision = self._page_revision(url)
+            except requests.RequestException as e:
+                logger.debug(f"Could not fetch cache validators for {url}: {e}")
+                return
+        self._write_atomic(self.validators_path(url), json.dumps(revision))
+        logger.debug(f"Stored cache validators for {url}: {revision}")
+
+    def is_unchanged(self, url):
+        # Revalidate the page and its content frame against the stored validators
+        if not self.enabled:
+            return False
+        validators_file = self.validators_path(url)
+        if not os.path.exists(validators_file):
+            return False
+        logger = logging.getLogger(__name__)
+        with open(validators_file, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
         try:
-            driver.find_element(By.NAME, iframe_name)
-            return True
-        except:
+            unchanged, _ = self._page_revision(url, previous)
+        except requests.RequestException as e:
+            logger.debug(f"Conditional request failed for {url}: {e}")
             return False
+        logger.debug(f"Revalidated {url}: {'unchanged' if unchanged else 'changed'}")
+        return unchanged
+
+# Debug utilities
+def write_debug_html(debug_path, html):
+    # Page dumps compress about tenfold and the fastest level costs almost no CPU
+    with gzip.open(debug_path, 'wt', encoding='utf-8', compresslevel=1) as f:
+        f.write(html)
+
+# Failure dumps keep the start of the page, which shows what loaded without storing whole pages per failure
+ERROR_HTML_MAX_CHARS = 64 * 1024
+ERROR_HTML_JS = "return document.documentElement.outerHTML.substring(0, arguments[0]);"
+
+def write_error_html(debug_path, driver, page_source=None):
+    # Without a snapshot at hand, truncate in the browser so only the kept prefix crosses the bridge
+    if page_source is None:
+        html = driver.execute_script(ERROR_HTML_JS, ERROR_HTML_MAX_CHARS)
+    else:
+        html = page_source[:ERROR_HTML_MAX_CHARS]
+    write_debug_html(debug_path, html)
+
+# Wait utilities
+def _ready_states(driver):
+    # An eager driver doesn't wait for subresources, so a parsed DOM is ready enough for it too
+    if driver.capabilities.get('pageLoadStrategy') == 'eager':
+        return ['interactive', 'complete']
+    return ['complete']
+
+def wait_for_document_ready(driver, timeout=10):
+    # Block until the current document (or frame) has finished loading instead of sleeping a fixed time
+    ready_states = _ready_states(driver)
+    WebDriverWait(driver, timeout).until(lambda d: d.execute_script("return document.readyState") in ready_states)
+
+# Waits for the document to reach one of readyStates, then scrolls to the bottom and waits for the
+# DOM to go quiet (no mutations for quietMs); scrolls again only if that load made the page taller.
+# Resolves with the final height, or after maxMs at most.
+SCROLL_UNTIL_SETTLED_JS = """
+var quietMs = arguments[0], maxMs = arguments[1], maxScrolls = arguments[2], readyStates = arguments[3];
+var done = arguments[arguments.length - 1];
+var scrolls = 0, heightBeforeScroll = 0, quietTimer = null, finished = false;
+var observer = new MutationObserver(function () {
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(settled, quietMs);
+});
+var maxTimer = setTimeout(finish, maxMs);
+function finish() {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(quietTimer);
+    clearTimeout(maxTimer);
+    document.removeEventListener('readystatechange', startWhenReady);
+    done(document.body ? document.body.scrollHeight : 0);
+}
+function scroll() {
+    heightBeforeScroll = document.body.scrollHeight;
+    scrolls++;
+    window.scrollTo(0, heightBeforeScroll);
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(settled, quietMs);
+}
+function settled() {
+    if (document.body.scrollHeight > heightBeforeScroll && scrolls < maxScrolls) {
+        scroll();
+    } else {
+        finish();
+    }
+}
+function startWhenReady() {
+    if (finished || !document.body || readyStates.indexOf(document.readyState) < 0) return;
+    document.removeEventListener('readystatechange', startWhenReady);
+    observer.observe(document.body, {childList: true, subtree: true});
+    scroll();
+}
+document.addEventListener('readystatechange', startWhenReady);
+startWhenReady();
+"""
+
+# Longest an async script may run; scroll_to_load only raises it for calls that need longer
+ASYNC_SCRIPT_TIMEOUT = 30
+
+def scroll_to_load(driver, max_scrolls=3, quiet_ms=500, max_ms=8000):
+    # One async call waits for the document, then does the whole scroll-and-settle loop in the browser;
+    # it returns as soon as lazy loading stops instead of after a fixed wait per scroll
+    if max_ms / 1000 + 5 > ASYNC_SCRIPT_TIMEOUT:
+        driver.set_script_timeout(max_ms / 1000 + 5)
+    return driver.execute_async_script(SCROLL_UNTIL_SETTLED_JS, quiet_ms, max_ms, max_scrolls, _ready_states(driver))
+
+# Iframe utilities
+def has_iframe(driver, iframe_name='content'):
+    # Match by id or name in one query; find_elements returns an empty list instead of raising on a miss
+    return bool(driver.find_elements(By.XPATH, f"//*[@id='{iframe_name}' or @name='{iframe_name}']"))
+
+# DOM snapshot utilities
+# Tags that Selenium's rendered .text separates onto their own lines
+BLOCK_TAGS = ('p', 'div', 'li', 'tr', 'table', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+# Nodes none of the scrapers read and Selenium never reports as visible text
+NON_CONTENT_TAGS = ('script', 'style', 'noscript')
+
+def parse_html(html, base_url):
+    tree = lxml.html.fromstring(html, base_url=base_url)
+    # Drop scripts, styles and comments up front so every XPath and text walk afterwards covers
+    # only page content; the text that follows them is kept
+    etree.strip_elements(tree, etree.Comment, *NON_CONTENT_TAGS, with_tail=False)
+    # Match Selenium's get_attribute('href'), which always returns absolute URLs
+    tree.make_links_absolute(base_url)
+    return tree
+
+def page_snapshot(driver):
+    # The current document (or frame) and its URL in a single bridge call
+    base_url, html = driver.execute_script("return [document.URL, document.documentElement.outerHTML]")
+    return html, base_url
+
+def _text_parts(element, root):
+    # Text of the subtree in document order, with a line break at each <br> and around each block below root
+    is_break = element is not root and element.tag in BLOCK_TAGS
+    if is_break:
+        yield '\n'
+    # Comments and processing instructions have a non-string tag; like text_content(), skip their text
+    if isinstance(element.tag, str) and element.text:
+        yield element.text
+    for child in element:
+        yield from _text_parts(child, root)
+    if element.tag == 'br' or is_break:
+        yield '\n'
+    if element is not root and element.tail:
+        yield element.tail
+
+def element_text(element):
+    # Approximate Selenium's .text for a parsed element: line breaks at <br> and block
+    # boundaries, whitespace collapsed within each line and blank lines dropped.
+    # Read-only, so the shared snapshot looks the same to every later XPath and text lookup.
+    if len(element):
+        text = ''.join(_text_parts(element, element))
+    else:
+        text = element.text or ''
+    lines = (' '.join(line.split()) for line in text.splitlines())
+    return '\n'.join(line for line in lines if line)
 
 # Screenshot utilities
+# Heights of every same-origin iframe in one call, plus the indexes of frames the script can't read
+IFRAME_HEIGHTS_JS = """
+var heights = [], blocked = [];
+var frames = document.getElementsByTagName('iframe');
+for (var i = 0; i < frames.length; i++) {
+    try {
+        heights.push(frames[i].contentDocument.body.scrollHeight);
+    } catch (e) {
+        blocked.push(i);
+    }
+}
+return [heights, blocked];
+"""
+
+# Page-style dates ("Sep 10, 2024 7:00 PM EDT") start with a month abbreviation
+_MONTH_NAME_RE = re.compile(r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)')
+
 def take_full_screenshot(driver, screenshot_dir, config, prefix='screenshot', board_name=None, date_str=None):
     logger = logging.getLogger(__name__)
     logger.debug(f"Taking full screenshot with prefix={prefix}, board_name={board_name}, date_str={date_str}")
@@ -127,7 +376,7 @@ def take_full_screenshot(driver, screenshot_dir, config, prefix='screenshot', bo
             filename_base += f"_{safe_board_name}"
         if date_str:
             date_clean = date_str.replace(" ", "").replace(",", "").replace("-", "")
-            if date_clean.startswith("Sep") or date_clean.startswith("Aug"):
+            if _MONTH_NAME_RE.match(date_clean):
                 date_clean = datetime.strptime(date_str, "%b %d, %Y %I:%M %p %Z").strftime("%Y%m%d")
             filename_base += f"_{date_clean}"
 
@@ -148,10 +397,15 @@ def take_full_screenshot(driver, screenshot_dir, config, prefix='screenshot', bo
             logger.debug(f"Fallback content height (document.body.scrollHeight): {content_height}")
 
         max_height = content_height
-        iframes = driver.find_elements(By.TAG_NAME, "iframe")
-        for iframe in iframes:
+        iframe_heights, blocked_frames = driver.execute_script(IFRAME_HEIGHTS_JS)
+        for iframe_height in iframe_heights:
+            max_height = max(max_height, iframe_height)
+            logger.debug(f"Iframe height: {iframe_height}")
+        # Cross-origin frames are only readable by switching into them
+        iframes = driver.find_elements(By.TAG_NAME, "iframe") if blocked_frames else []
+        for index in blocked_frames:
             try:
-                driver.switch_to.frame(iframe)
+                driver.switch_to.frame(iframes[index])
                 iframe_height = driver.execute_script("return document.body.scrollHeight")
                 max_height = max(max_height, iframe_height)
                 logger.debug(f"Iframe height: {iframe_height}")
@@ -204,23 +458,21 @@ def capture_screenshot(driver, screenshot_dir, config, prefix='screenshot', boar
     logger.debug(f"Capturing screenshot with prefix={prefix}, board_name={board_name}, date_str={date_str}, wait_selector={wait_selector}")
     
     try:
-        # Check for content iframe with retries
+        # Poll until the content iframe can be entered instead of sleeping between fixed retries
         iframe_exists = False
-        for attempt in range(3):
-            if has_iframe(driver, 'content'):
-                try:
-                    driver.switch_to.frame('content')
-                    logger.debug(f"Switched to content iframe on attempt {attempt + 1}")
-                    iframe_exists = True
-                    break
-                except Exception as e:
-                    logger.warning(f"Failed to switch to content iframe on attempt {attempt + 1}: {e}")
-                    driver.switch_to.default_content()
-                    time.sleep(2)
-            else:
-                logger.debug("No content iframe found")
+        if has_iframe(driver, 'content'):
+            try:
+                WebDriverWait(driver, 6, poll_frequency=0.25).until(
+                    EC.frame_to_be_available_and_switch_to_it('content')
+                )
+                logger.debug("Switched to content iframe")
+                iframe_exists = True
+            except TimeoutException as e:
+                logger.warning(f"Failed to switch to content iframe: {e}")
                 driver.switch_to.default_content()
-                break
+        else:
+            logger.debug("No content iframe found")
+            driver.switch_to.default_content()
 
         # Wait for content to load
         wait = WebDriverWait(driver, 20)
@@ -235,14 +487,7 @@ def capture_screenshot(driver, screenshot_dir, config, prefix='screenshot', boar
             logger.debug("Body element found, page loaded")
 
         # Scroll to bottom to load dynamic content
-        last_height = driver.execute_script("return document.body.scrollHeight")
-        for _ in range(5):
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(3)
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                break
-            last_height = new_height
+        last_height = scroll_to_load(driver, max_scrolls=5, max_ms=15000)
         logger.debug(f"Final scroll height: {last_height}")
 
         # Take screenshot
@@ -253,10 +498,9 @@ def capture_screenshot(driver, screenshot_dir, config, prefix='screenshot', boar
         return png_path, pdf_path
     except Exception as e:
         logger.error(f"Error capturing screenshot: {e}", exc_info=True)
-        debug_path = os.path.join(screenshot_dir, "debug", f"screenshot_error_{int(time.time())}.html")
+        debug_path = os.path.join(screenshot_dir, "debug", f"screenshot_error_{int(time.time())}.html.gz")
         os.makedirs(os.path.dirname(debug_path), exist_ok=True)
-        with open(debug_path, "w", encoding="utf-8") as f:
-            f.write(driver.page_source)
+        write_error_html(debug_path, driver)
         logger.info(f"Saved debug HTML for screenshot error: {debug_path}")
         return None, None
     finally:
@@ -268,18 +512,73 @@ def capture_screenshot(driver, screenshot_dir, config, prefix='screenshot', boar
                 logger.error(f"Error switching back to default content: {e}")
 
 # Selenium setup
-def setup_driver(headless=True):
-    chrome_options = Options()
-    if headless:
-        chrome_options.add_argument('--headless=new')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--window-size=1920,4000')
-    driver = webdriver.Chrome(options=chrome_options)
+# Requests the scrapers never need; images and fonts only matter when screenshots are taken
+TRACKER_URL_PATTERNS = ['*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*']
+MEDIA_URL_PATTERNS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.woff', '*.woff2', '*.ttf', '*.otf']
+# Browser features an unattended scraper never uses; turning them off trims startup time and memory.
+# /dev/shm is often tiny in containers, and a full one crashes the renderer on large pages.
+CHROME_LEAN_ARGS = [
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-features=Translate',
+    '--disable-renderer-backgrounding',
+    '--disable-backgrounding-occluded-windows',
+    '--no-first-run',
+]
+
+def setup_driver(headless=True, debugger_address=None, block_media=False):
+    logger = logging.getLogger(__name__)
+    driver = None
+    if debugger_address:
+        # Attach to a Chrome that is kept running between runs (started with --remote-debugging-port)
+        # so each run skips the browser cold start; launch a fresh one if it is not reachable
+        attach_options = Options()
+        attach_options.add_experimental_option('debuggerAddress', debugger_address)
+        if block_media:
+            attach_options.page_load_strategy = 'eager'
+        try:
+            driver = webdriver.Chrome(options=attach_options)
+            logger.info(f"Attached to running browser at {debugger_address}")
+        except Exception as e:
+            logger.warning(f"Could not attach to browser at {debugger_address}, launching a new one: {e}")
+
+    if driver is None:
+        chrome_options = Options()
+        if headless:
+            chrome_options.add_argument('--headless=new')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--window-size=1920,4000')
+        for arg in CHROME_LEAN_ARGS:
+            chrome_options.add_argument(arg)
+        if block_media:
+            # Nothing will be photographed, so stop waiting at DOMContentLoaded instead of for every subresource
+            chrome_options.page_load_strategy = 'eager'
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        driver = webdriver.Chrome(options=chrome_options)
+
+    # Every wait in the scrapers is an explicit WebDriverWait; an implicit wait would stack onto each
+    # of their polls and onto every optional lookup that is expected to miss
+    driver.implicitly_wait(0)
+    driver.set_script_timeout(ASYNC_SCRIPT_TIMEOUT)
+
+    # Only the HTML is scraped, so don't spend page-load time downloading what nothing reads
+    blocked_urls = TRACKER_URL_PATTERNS + (MEDIA_URL_PATTERNS if block_media else [])
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_urls})
+    except Exception as e:
+        logger.warning(f"Could not set blocked URLs, loading pages in full: {e}")
     return driver
 
 # Fetch page with caching and retries
-def fetch_page(driver, url, cache, retries=3, delay=5, bypass_cache=False):
+BODY_LENGTH_JS = "return document.body ? document.body.innerHTML.trim().length : 0;"
+
+def fetch_page(driver, url, cache, retries=3, delay=5, bypass_cache=False, save_debug_html=False):
     logger = logging.getLogger(__name__)
     logger.debug(f"Fetching page: {url}, bypass_cache={bypass_cache}")
 
@@ -290,25 +589,39 @@ def fetch_page(driver, url, cache, retries=3, delay=5, bypass_cache=False):
         content = None
         if cache.is_cached(url):
             logger.info(f"Invalid cached content for {url}, forcing fresh fetch")
+        # Where the last successful navigation landed; None until driver.get has returned without error
+        loaded_url = None
         for attempt in range(retries):
             try:
                 logger.debug(f"Attempt {attempt + 1}/{retries} to fetch {url}")
-                driver.get(url)
+                # A retry after a failed wait or content check reuses the page that is still loading, which
+                # usually just needed longer. Navigate again on the first and last attempts, after a failed
+                # driver.get (Chrome would be showing its own error page), or once the browser has moved off
+                # the page that was loaded.
+                if 0 < attempt < retries - 1 and loaded_url is not None and driver.current_url == loaded_url:
+                    driver.switch_to.default_content()
+                else:
+                    loaded_url = None
+                    driver.get(url)
+                    loaded_url = driver.current_url
                 WebDriverWait(driver, 20).until(
                     EC.presence_of_element_located((By.TAG_NAME, 'body'))
                 )
-                time.sleep(2)
-                
-                body_content = driver.find_element(By.TAG_NAME, 'body').get_attribute('innerHTML').strip()
-                if not body_content or '<body></body>' in driver.page_source:
+                wait_for_document_ready(driver)
+
+                # Measure the body in the browser so only a number crosses the bridge; the top-level
+                # document itself is pulled at most once, and only when it is the content or being dumped
+                if not driver.execute_script(BODY_LENGTH_JS):
                     raise ValueError("Page loaded but contains no meaningful content")
 
-                debug_path = os.path.join(cache.cache_dir, 'debug', f"fetch_{hashlib.md5(url.encode()).hexdigest()}_{int(time.time())}.html")
-                os.makedirs(os.path.dirname(debug_path), exist_ok=True)
-                with open(debug_path, 'w', encoding='utf-8') as f:
-                    f.write(driver.page_source)
-                logger.info(f"Saved debug HTML: {debug_path}")
-                
+                page_source = None
+                if save_debug_html:
+                    page_source = driver.page_source
+                    debug_path = os.path.join(cache.cache_dir, 'debug', f"fetch_{hashlib.md5(url.encode()).hexdigest()}_{int(time.time())}.html.gz")
+                    os.makedirs(os.path.dirname(debug_path), exist_ok=True)
+                    write_debug_html(debug_path, page_source)
+                    logger.info(f"Saved debug HTML: {debug_path}")
+
                 iframe_exists = has_iframe(driver, 'content')
                 if iframe_exists:
                     logger.debug("Switching to content iframe")
@@ -317,7 +630,7 @@ def fetch_page(driver, url, cache, retries=3, delay=5, bypass_cache=False):
                     driver.switch_to.default_content()
                 else:
                     logger.debug("No content iframe found, using default content")
-                    content = driver.page_source
+                    content = page_source or driver.page_source
                 
                 if '<body></body>' in content or len(content.strip()) < 100:
                     raise ValueError("Fetched content is empty or invalid")
@@ -8,19 +8,53 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import time
-from mytowngov_common import load_config, setup_driver, fetch_page, capture_screenshot, Cache, has_iframe
+from mytowngov_common import load_config, setup_driver, fetch_page, capture_screenshot, Cache, has_iframe, write_error_html
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# The homepage sections that list links, each with its heading XPath built once
+BOARDS_HEADING = "Boards and Committees"
+AGENCIES_HEADING = "Outside Agencies and Organizations"
+SECTION_HEADING_XPATHS = {
+    heading: f"//h1[contains(text(), '{heading}')]" for heading in (BOARDS_HEADING, AGENCIES_HEADING)
+}
+
+# Finds the section heading, walks to its next <table> sibling and returns [link text, href] for the
+# first-cell link of every body row, all in one WebDriver call. Resolves to null until the heading
+# exists, otherwise to [rows], with rows null when no table follows the heading.
+SECTION_LINKS_JS = """
+var heading = document.evaluate(
+    arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+if (!heading) {
+    return null;
+}
+var node = heading.nextElementSibling;
+while (node && node.tagName !== 'TABLE') {
+    node = node.nextElementSibling;
+}
+if (!node) {
+    return [null];
+}
+return [Array.from(node.rows).slice(1).map(function (row) {
+    var link = row.cells.length ? row.cells[0].querySelector('a') : null;
+    return link ? [link.innerText, link.href] : null;
+})];
+"""
+
 class HomepageScraper:
-    def __init__(self, config_path='config.yaml'):
+    def __init__(self, config_path='config.yaml', driver=None):
         self.config = load_config(config_path)
         self.base_url = self.config['homepage_url']
         self.data_dir = self.config['data_dir']
         self.use_cache = self.config.get('use_cache', True)
         self.cache = Cache(self.config)
-        self.driver = setup_driver(headless=True)
+        self._owns_driver = driver is None
+        self.driver = driver or setup_driver(
+            headless=True, debugger_address=self.config.get('browser_debugger_address'),
+            block_media=not self.config.get('screenshots', {}).get('enabled', True)
+        )
         self.wait = WebDriverWait(self.driver, 20)
         self.screenshots_enabled = self.config.get('screenshots', {}).get('enabled', True)
         self.board_dir = os.path.join(self.data_dir, 'homepage')
@@ -28,7 +62,8 @@ class HomepageScraper:
 
     def _scrape_dropdown(self, heading_text):
         logger.info(f"Scraping section: {heading_text}")
-        boards = []
+        # Collected column by column so the DataFrame is built without per-row dict inference
+        boards = {'Name': [], 'URL': []}
 
         try:
             logger.debug("Waiting for content iframe to be present")
@@ -37,35 +72,29 @@ class HomepageScraper:
             self.driver.switch_to.frame(iframe)
 
             logger.debug(f"Waiting for heading '{heading_text}' in iframe")
-            heading = self.wait.until(EC.presence_of_element_located((By.XPATH, f"//h1[contains(text(), '{heading_text}')]")))
-            logger.debug(f"Found heading: {heading_text}")
-
-            table = heading.find_element(By.XPATH, "following-sibling::table")
-            logger.debug("Located table")
-
-            rows = table.find_elements(By.TAG_NAME, "tr")[1:]
+            heading_xpath = SECTION_HEADING_XPATHS[heading_text]
+            # Each poll either finds nothing yet or returns the whole table's links
+            rows = self.wait.until(lambda driver: driver.execute_script(SECTION_LINKS_JS, heading_xpath))[0]
+            if rows is None:
+                raise NoSuchElementException(f"No table follows heading '{heading_text}'")
             logger.debug(f"Found {len(rows)} rows in {heading_text}")
 
             for row in rows:
-                try:
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    if len(cells) >= 1:
-                        link = cells[0].find_element(By.TAG_NAME, "a")
-                        name = link.text.strip()
-                        name = name.replace(" (inactive)", "")
-                        url = link.get_attribute('href')
-                        if name and url:
-                            boards.append({'Name': name, 'URL': url})
-                            logger.debug(f"Scraped board: {name} - {url}")
-                except Exception as e:
-                    logger.error(f"Error processing row in {heading_text}: {e}")
+                if not row:
+                    logger.debug(f"Skipping row without a link in {heading_text}")
+                    continue
+                link_text, url = row
+                name = link_text.strip().replace(" (inactive)", "")
+                if name and url:
+                    boards['Name'].append(name)
+                    boards['URL'].append(url)
+                    logger.debug(f"Scraped board: {name} - {url}")
 
         except TimeoutException as e:
             logger.error(f"Error scraping {heading_text}: {e}")
-            debug_path = os.path.join(self.board_dir, 'debug', f"iframe_content_{int(time.time())}.html")
+            debug_path = os.path.join(self.board_dir, 'debug', f"iframe_content_{int(time.time())}.html.gz")
             os.makedirs(os.path.dirname(debug_path), exist_ok=True)
-            with open(debug_path, 'w', encoding='utf-8') as f:
-                f.write(self.driver.page_source)
+            write_error_html(debug_path, self.driver)
             logger.info(f"Saved debug HTML: {debug_path}")
         except Exception as e:
             logger.error(f"Unexpected error in _scrape_dropdown for {heading_text}: {e}")
@@ -77,13 +106,14 @@ class HomepageScraper:
 
     def scrape(self):
         logger.info(f"Scraping homepage: {self.base_url}")
-        boards_data = []
-        agencies_data = []
 
-        content = fetch_page(self.driver, self.base_url, self.cache, bypass_cache=not self.use_cache)
+        content = fetch_page(
+            self.driver, self.base_url, self.cache, bypass_cache=not self.use_cache,
+            save_debug_html=self.config.get('debug', False)
+        )
 
         if self.screenshots_enabled:
-            wait_selector = (By.XPATH, "//h1[contains(text(), 'Boards and Committees')]")
+            wait_selector = (By.XPATH, SECTION_HEADING_XPATHS[BOARDS_HEADING])
             png_path, pdf_path = capture_screenshot(
                 self.driver, self.board_dir, self.config, prefix="homepage", wait_selector=wait_selector
             )
@@ -92,13 +122,10 @@ class HomepageScraper:
             else:
                 logger.error("Failed to save screenshot")
 
-        boards = self._scrape_dropdown("Boards and Committees")
-        boards_data.extend(boards)
-
-        agencies = self._scrape_dropdown("Outside Agencies and Organizations")
-        agencies_data.extend(agencies)
+        boards_data = self._scrape_dropdown(BOARDS_HEADING)
+        agencies_data = self._scrape_dropdown(AGENCIES_HEADING)
 
-        if boards_data:
+        if boards_data['Name']:
             df_boards = pd.DataFrame(boards_data)
             boards_csv = self.config['homepage_boards_csv']
             os.makedirs(os.path.dirname(boards_csv), exist_ok=True)
@@ -107,7 +134,7 @@ class HomepageScraper:
         else:
             logger.warning("No data to save for homepage_boards_and_committees.csv")
 
-        if agencies_data:
+        if agencies_data['Name']:
             df_agencies = pd.DataFrame(agencies_data)
             agencies_csv = self.config['homepage_agencies_csv']
             os.makedirs(os.path.dirname(agencies_csv), exist_ok=True)
@@ -119,6 +146,9 @@ class HomepageScraper:
         logger.info("Homepage scraping completed")
 
     def close(self):
+        # A driver handed in by the caller is theirs to quit
+        if not self._owns_driver:
+            return
         try:
             self.driver.quit()
         except Exception as e:
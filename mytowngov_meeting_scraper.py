@@ -1,44 +1,78 @@
 #!/usr/bin/env python3
 
 import os
+import csv
 import logging
 import pandas as pd
 import requests
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 import time
-import datetime
 import sys
 from urllib.parse import urljoin
-from mytowngov_common import load_config, setup_driver, fetch_page, capture_screenshot, Cache, has_iframe
+from lxml import etree
+from mytowngov_common import (
+    load_config, setup_driver, fetch_page, capture_screenshot, Cache, has_iframe, element_text,
+    scroll_to_load, write_debug_html, write_error_html, parse_html, page_snapshot
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Compiled once and evaluated against an lxml snapshot of the meeting page instead of over the WebDriver bridge.
+# Only the first title, location, agenda label, agenda block and minutes link are read, so those searches
+# stop at the first match.
+_XP_TITLE = etree.XPath("(//h1)[1]")
+_XP_LOCATION = etree.XPath("(//*[contains(text(), 'Location:')])[1]")
+_XP_AGENDA_LABEL = etree.XPath("(//*[contains(text(), 'Agenda')])[1]")
+_XP_AGENDA_FALLBACK = etree.XPath("(//textarea[contains(@name, 'agenda')] | //div[contains(@class, 'agenda')])[1]")
+_XP_MINUTES_HREF = etree.XPath("(//a[contains(text(), 'Minutes')])[1]/@href")
+_XP_VIEWER_LINKS = etree.XPath("//a[contains(@href, 'viewer')]")
+_XP_DOWNLOAD_SIBLING = etree.XPath(
+    "following-sibling::a[contains(@href, 'download')] | preceding-sibling::a[contains(@href, 'download')]"
+)
+AGENDA_TEXT_TAGS = ('p', 'div', 'textarea')
+
 class MeetingScraper:
-    def __init__(self, config_path='config.yaml', headless=True, bypass_cache=True):
+    def __init__(self, config_path='config.yaml', headless=True, bypass_cache=True, driver=None):
         self.config = load_config(config_path)
         self.base_url = self.config['base_url']
         self.data_dir = self.config['data_dir']
         self.boards_data_dir = self.config['boards_data_dir']
         self.use_cache = self.config.get('use_cache', True)
         self.cache = Cache(self.config)
-        self.driver = setup_driver(headless=headless)
-        self.wait = WebDriverWait(self.driver, 15)
+        self._owns_driver = driver is None
+        self.driver = driver or setup_driver(
+            headless=headless, debugger_address=self.config.get('browser_debugger_address'),
+            block_media=not self.config.get('screenshots', {}).get('enabled', True)
+        )
         self.screenshots_enabled = self.config.get('screenshots', {}).get('enabled', True)
         self.focus_mode = self.config.get('focus_mode_meetings', False)
-        self.focus_date = self.config.get('focus_date', None)
+        # Normalized once to the ISO string the meeting rows are compared against; YAML reads an
+        # unquoted 2024-09-10 as a date object, which would never equal a string
+        focus_date = self.config.get('focus_date', None)
+        self.focus_date = str(focus_date) if focus_date else None
         self.focus_board = self.config.get('focus_board', None)
         self.bypass_cache = bypass_cache
-
-    def _log_page_state(self, context="unknown"):
+        # Page snapshots on the success path are only worth their disk space while debugging
+        self.save_debug_html = self.config.get('debug', False)
+
+    def _log_page_state(self, context="unknown", failed=False):
+        # Every line below costs a WebDriver round trip, so skip them all unless they will be logged
+        if not logger.isEnabledFor(logging.DEBUG):
+            # A failure still gets the one round trip that says which page it happened on
+            if failed:
+                try:
+                    logger.info(f"Page at failure ({context}): {self.driver.current_url}")
+                except Exception as e:
+                    logger.error(f"Error logging page URL: {e}")
+            return
         try:
             logger.debug(f"Logging page state ({context})")
             logger.debug(f"Current URL: {self.driver.current_url}")
             logger.debug(f"Page title: {self.driver.title}")
-            page_content = self.driver.page_source[:1000]
+            # Slice in the browser so only the logged prefix crosses the WebDriver bridge
+            page_content = self.driver.execute_script("return document.documentElement.outerHTML.substring(0, 1000)")
             logger.debug(f"Page content (first 1000 chars): {page_content}")
         except Exception as e:
             logger.error(f"Error logging page state: {e}")
@@ -77,7 +111,9 @@ class MeetingScraper:
         os.makedirs(meeting_dir, exist_ok=True)
 
         try:
-            content = fetch_page(self.driver, details_url, self.cache, bypass_cache=self.bypass_cache)
+            content = fetch_page(
+                self.driver, details_url, self.cache, bypass_cache=self.bypass_cache, save_debug_html=self.save_debug_html
+            )
 
             current_url = self.driver.current_url
             if 'data:,' in current_url:
@@ -97,86 +133,79 @@ class MeetingScraper:
 
             self._log_page_state("after loading meeting page")
 
-            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, 'body')))
-            time.sleep(2)
-
+            # The scroll script waits for the document to be ready before it starts
             logger.debug("Scrolling to load content")
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-            for _ in range(3):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
-                    break
-                last_height = new_height
+            last_height = scroll_to_load(self.driver)
             logger.debug(f"Final scroll height: {last_height}")
 
-            debug_path = os.path.join(meeting_dir, f"meeting_{safe_board_name}_{meeting_date}_{int(time.time())}.html")
-            os.makedirs(os.path.dirname(debug_path), exist_ok=True)
-            with open(debug_path, "w", encoding="utf-8") as f:
-                f.write(self.driver.page_source)
-            logger.info(f"Saved meeting debug HTML: {debug_path}")
-
-            try:
-                title_element = self.driver.find_element(By.TAG_NAME, 'h1')
-                details['title'] = title_element.text.strip()
+            # Pull the rendered page across the bridge once; every lookup below runs on the parsed copy
+            page_source, base_url = page_snapshot(self.driver)
+            if self.save_debug_html:
+                debug_path = os.path.join(meeting_dir, f"meeting_{safe_board_name}_{meeting_date}_{int(time.time())}.html.gz")
+                write_debug_html(debug_path, page_source)
+                logger.info(f"Saved meeting debug HTML: {debug_path}")
+            tree = parse_html(page_source, base_url)
+
+            title_elements = _XP_TITLE(tree)
+            if title_elements:
+                details['title'] = element_text(title_elements[0])
                 logger.debug(f"Found meeting title: {details['title']}")
-            except NoSuchElementException:
+            else:
                 logger.warning("Meeting title not found")
 
-            try:
-                location_element = self.driver.find_element(By.XPATH, "//*[contains(text(), 'Location:')]")
-                details['location'] = location_element.text.replace('Location:', '').strip()
+            location_elements = _XP_LOCATION(tree)
+            if location_elements:
+                details['location'] = element_text(location_elements[0]).replace('Location:', '').strip()
                 logger.debug(f"Found location: {details['location']}")
-            except NoSuchElementException:
+            else:
                 logger.debug("Location not found")
 
-            try:
-                agenda_label = self.driver.find_element(By.XPATH, "//*[contains(text(), 'Agenda')]")
-                agenda_text = None
-                for sibling in agenda_label.find_elements(By.XPATH, "following-sibling::*"):
-                    if sibling.tag_name in ['p', 'div', 'textarea']:
-                        agenda_text = sibling.text.strip()
+            agenda_labels = _XP_AGENDA_LABEL(tree)
+            agenda_text = None
+            if agenda_labels:
+                for sibling in agenda_labels[0].itersiblings():
+                    if sibling.tag in AGENDA_TEXT_TAGS:
+                        agenda_text = element_text(sibling)
                         if agenda_text:
                             break
                 if not agenda_text:
-                    agenda_text = self.driver.find_element(By.XPATH, "//textarea[contains(@name, 'agenda')] | //div[contains(@class, 'agenda')]").text.strip()
+                    agenda_fallback = _XP_AGENDA_FALLBACK(tree)
+                    agenda_text = element_text(agenda_fallback[0]) if agenda_fallback else None
+            if agenda_text is not None:
                 details['agenda'] = agenda_text
                 logger.debug(f"Found agenda text: {details['agenda'][:100]}...")
-            except NoSuchElementException:
+            else:
                 logger.debug("Agenda text not found")
 
-            try:
-                minutes_element = self.driver.find_element(By.XPATH, "//a[contains(text(), 'Minutes')]")
-                details['minutes'] = minutes_element.get_attribute('href')
+            minutes_hrefs = _XP_MINUTES_HREF(tree)
+            if minutes_hrefs:
+                details['minutes'] = str(minutes_hrefs[0])
                 logger.debug(f"Found minutes: {details['minutes']}")
                 if details['minutes']:
                     attachment_path = self._download_attachment(details['minutes'], meeting_dir)
                     if attachment_path:
                         details['documents'].append(attachment_path)
-            except NoSuchElementException:
+            else:
                 logger.debug("Minutes link not found")
 
             try:
-                viewer_links = self.driver.find_elements(By.XPATH, "//a[contains(@href, 'viewer')]")
-                for viewer_link in viewer_links:
-                    try:
-                        file_name = viewer_link.text.strip()
-                        if not file_name:
-                            logger.debug("Viewer link has no text, skipping")
-                            continue
-                        logger.debug(f"Found viewer link with file name: {file_name}")
-
-                        download_link = viewer_link.find_element(By.XPATH, "following-sibling::a[contains(@href, 'download')] | preceding-sibling::a[contains(@href, 'download')]")
-                        download_url = download_link.get_attribute('href')
-                        logger.debug(f"Found download link: {download_url}")
-
-                        attachment_path = self._download_attachment(download_url, meeting_dir, filename=file_name)
-                        if attachment_path:
-                            details['documents'].append(attachment_path)
-                    except NoSuchElementException:
-                        logger.debug(f"No download link found for viewer link: {viewer_link.get_attribute('href')}")
+                for viewer_link in _XP_VIEWER_LINKS(tree):
+                    file_name = element_text(viewer_link)
+                    if not file_name:
+                        logger.debug("Viewer link has no text, skipping")
+                        continue
+                    logger.debug(f"Found viewer link with file name: {file_name}")
+
+                    download_links = _XP_DOWNLOAD_SIBLING(viewer_link)
+                    if not download_links:
+                        logger.debug(f"No download link found for viewer link: {viewer_link.get('href')}")
                         continue
+                    download_url = download_links[0].get('href')
+                    logger.debug(f"Found download link: {download_url}")
+
+                    attachment_path = self._download_attachment(download_url, meeting_dir, filename=file_name)
+                    if attachment_path:
+                        details['documents'].append(attachment_path)
             except Exception as e:
                 logger.error(f"Error scraping documents: {e}")
 
@@ -195,12 +224,11 @@ class MeetingScraper:
 
         except Exception as e:
             logger.error(f"Error scraping meeting details for {details_url}: {e}")
-            debug_path = os.path.join(meeting_dir, f"meeting_error_{safe_board_name}_{meeting_date}_{int(time.time())}.html")
+            debug_path = os.path.join(meeting_dir, f"meeting_error_{safe_board_name}_{meeting_date}_{int(time.time())}.html.gz")
             os.makedirs(os.path.dirname(debug_path), exist_ok=True)
-            with open(debug_path, "w", encoding="utf-8") as f:
-                f.write(self.driver.page_source)
+            write_error_html(debug_path, self.driver)
             logger.info(f"Saved debug HTML for meeting error: {debug_path}")
-            self._log_page_state("after meeting details failure")
+            self._log_page_state("after meeting details failure", failed=True)
         finally:
             if iframe_exists:
                 try:
@@ -227,49 +255,52 @@ class MeetingScraper:
             print(error_msg)
             sys.exit(1)
 
-        meeting_details = []
+        meetings_saved = 0
 
         for board_name, meetings_csv in boards_to_process:
             logger.info(f"Processing meetings for board: {board_name}")
             df = pd.read_csv(meetings_csv)
-            for _, row in df.iterrows():
-                board_name = row['board_name']
-                meeting_date = row['date']
-                details_url = row['details_url']
-
-                if not isinstance(board_name, str) or pd.isna(board_name) or not isinstance(details_url, str) or pd.isna(details_url):
-                    logger.warning(f"Skipping invalid meeting: board_name={board_name}, details_url={details_url}")
-                    continue
-
-                try:
-                    date_obj = datetime.datetime.strptime(meeting_date.split()[0], "%Y-%m-%d").date()
-                    date_str = date_obj.strftime("%Y-%m-%d")
-                except (ValueError, AttributeError) as e:
-                    logger.warning(f"Could not parse meeting date '{meeting_date}': {e}")
-                    continue
-
-                if self.focus_mode and self.focus_date:
-                    if date_str != self.focus_date or board_name != self.focus_board:
-                        logger.debug(f"Skipping meeting for {board_name} on {date_str} (focus mode enabled for {self.focus_board} on {self.focus_date})")
-                        continue
-
+            invalid = df['board_name'].isna() | df['details_url'].isna()
+            if invalid.any():
+                logger.warning(f"Skipping {invalid.sum()} meetings without a board name or details URL")
+                df = df[~invalid]
+
+            # The board CSV stores ISO timestamps, so the date part already is the ISO date string;
+            # parsing it only validates it, and the string is kept rather than formatted back row by row
+            date_parts = df['date'].astype(str).str.split(n=1).str[0]
+            dates = pd.to_datetime(date_parts, format="%Y-%m-%d", errors="coerce")
+            for meeting_date in df.loc[dates.isna(), 'date']:
+                logger.warning(f"Could not parse meeting date '{meeting_date}'")
+            df = df.assign(date_str=date_parts)[dates.notna()]
+
+            if self.focus_mode and self.focus_date:
+                in_focus = (df['date_str'] == self.focus_date) & (df['board_name'] == self.focus_board)
+                logger.debug(f"Focus mode: {in_focus.sum()} of {len(df)} meetings are for {self.focus_board} on {self.focus_date}")
+                df = df[in_focus]
+
+            for board_name, date_str, details_url in zip(
+                df['board_name'].to_numpy(), df['date_str'].to_numpy(), df['details_url'].to_numpy()
+            ):
                 logger.info(f"Scraping meeting for {board_name} on {date_str}")
                 details, meeting_dir = self._scrape_meeting_details(board_name, date_str, details_url)
-                meeting_details.append(details)
-
-                if meeting_details:
-                    df_details = pd.DataFrame([details])
-                    safe_board_name = board_name.replace(" ", "_").replace("/", "_")
-                    output_csv = os.path.join(meeting_dir, f"meeting_{safe_board_name}_{date_str}.csv")
-                    os.makedirs(os.path.dirname(output_csv), exist_ok=True)
-                    df_details.to_csv(output_csv, index=False)
-                    logger.info(f"Saved meeting details to {output_csv}")
-                else:
-                    logger.warning(f"No meeting details to save for {board_name} on {date_str}")
 
-        logger.info("Meeting scraping completed successfully")
+                # One row per meeting, written straight out rather than through a DataFrame
+                safe_board_name = board_name.replace(" ", "_").replace("/", "_")
+                output_csv = os.path.join(meeting_dir, f"meeting_{safe_board_name}_{date_str}.csv")
+                os.makedirs(os.path.dirname(output_csv), exist_ok=True)
+                with open(output_csv, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.DictWriter(f, fieldnames=list(details))
+                    writer.writeheader()
+                    writer.writerow(details)
+                meetings_saved += 1
+                logger.info(f"Saved meeting details to {output_csv}")
+
+        logger.info(f"Meeting scraping completed successfully, saved {meetings_saved} meetings")
 
     def close(self):
+        # A driver handed in by the caller is theirs to quit
+        if not self._owns_driver:
+            return
         try:
             self.driver.quit()
         except Exception as e:
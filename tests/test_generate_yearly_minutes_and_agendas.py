@@ -0,0 +1,36 @@
+import pandas as pd
+
+from generate_yearly_minutes_and_agendas import (
+    DOCUMENT_CSV_COLUMNS, attachment_extensions, read_report_csv
+)
+
+
+def test_attachment_extensions_from_documents_csv(tmp_path):
+    documents_csv = tmp_path / "board_documents.csv"
+    documents_csv.write_text(
+        "Timestamp,File Name,File Path,Unused\n"
+        "2024-09-10 19:00:00,Agenda.DOCX,Hardwick_Data/Board/Attachments/Agenda.DOCX,x\n"
+        "2024-09-10 19:00:00,Minutes.pdf,Hardwick_Data/Board/Attachments/Minutes.pdf,x\n"
+        "2024-09-10 19:00:00,README,Hardwick_Data/Board.v2/Attachments/README,x\n",
+        encoding="utf-8",
+    )
+
+    documents_df = read_report_csv(str(documents_csv), DOCUMENT_CSV_COLUMNS)
+
+    assert list(documents_df.columns) == DOCUMENT_CSV_COLUMNS
+    assert attachment_extensions(documents_df["File Path"]).tolist() == ["docx", "pdf", ""]
+
+
+def test_read_report_csv_skips_missing_columns(tmp_path):
+    meeting_csv = tmp_path / "board_meeting_data.csv"
+    meeting_csv.write_text("Timestamp\n2024-09-10 19:00:00\n", encoding="utf-8")
+
+    meetings_df = read_report_csv(str(meeting_csv), ["Timestamp", "Agenda"])
+
+    assert list(meetings_df.columns) == ["Timestamp"]
+
+
+def test_attachment_extensions_on_empty_documents():
+    empty = pd.DataFrame(columns=DOCUMENT_CSV_COLUMNS)
+
+    assert attachment_extensions(empty["File Path"]).tolist() == []
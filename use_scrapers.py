@@ -3,6 +3,7 @@
 import logging
 import yaml
 import os
+from mytowngov_common import setup_driver
 from mytowngov_homepage_scraper import HomepageScraper
 from mytowngov_board_scraper import BoardScraper
 from mytowngov_meeting_scraper import MeetingScraper
@@ -29,11 +30,25 @@ def main():
     config_path = 'config.yaml'
     config = load_config(config_path)
 
+    # One browser for all three steps instead of launching and quitting Chrome for each of them
+    driver = setup_driver(
+        headless=True, debugger_address=config.get('browser_debugger_address'),
+        block_media=not config.get('screenshots', {}).get('enabled', True)
+    )
+    try:
+        run_scrapers(config_path, driver)
+    finally:
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.error(f"Error closing driver: {e}")
+
+def run_scrapers(config_path, driver):
     # Step 1: Scrape the homepage
     logging.info("Starting homepage scraping")
     homepage_scraper = None
     try:
-        homepage_scraper = HomepageScraper(config_path)
+        homepage_scraper = HomepageScraper(config_path, driver=driver)
         homepage_scraper.scrape()
     except Exception as e:
         logging.error(f"Homepage scraping failed: {e}")
@@ -46,7 +61,7 @@ def main():
     logging.info("Starting board scraping")
     board_scraper = None
     try:
-        board_scraper = BoardScraper(config_path)
+        board_scraper = BoardScraper(config_path, driver=driver)
         board_scraper.scrape()
     except Exception as e:
         logging.error(f"Board scraping failed: {e}")
@@ -59,7 +74,7 @@ def main():
     logging.info("Starting meeting scraping")
     meeting_scraper = None
     try:
-        meeting_scraper = MeetingScraper(config_path)
+        meeting_scraper = MeetingScraper(config_path, driver=driver)
         meeting_scraper.scrape()
     except Exception as e:
         logging.error(f"Meeting scraping failed: {e}")